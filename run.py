@@ -8,46 +8,98 @@ Usage: python3 run.py "your instruction here"
 
 import sys
 import os
-from pathlib import Path
-
-# Add src to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 VENV_RESTART_FLAG = "--__venv_restarted__"
+DEPS_SENTINEL = os.path.join("venv", ".deps_ok")
+DEPS_MANIFESTS = ("requirements-core.txt", "requirements.txt", "pyproject.toml")
+
+def _deps_digest(project_root) -> str:
+    """Hash the dependency manifests and interpreter version that a bootstrap installed against"""
+    import hashlib
+    digest = hashlib.blake2b(sys.version.encode())
+    for name in DEPS_MANIFESTS:
+        try:
+            with open(os.path.join(project_root, name), "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+def _deps_sentinel_valid(project_root) -> bool:
+    """Check whether the venv was bootstrapped against the current manifests"""
+    try:
+        with open(os.path.join(project_root, DEPS_SENTINEL), "r") as f:
+            return f.read().strip() == _deps_digest(project_root)
+    except OSError:
+        return False
+
+def _write_deps_sentinel(project_root) -> None:
+    """Record a successful bootstrap so later launches can skip re-verifying the venv"""
+    sentinel = os.path.join(project_root, DEPS_SENTINEL)
+    try:
+        with open(sentinel + ".tmp", "w") as f:
+            f.write(_deps_digest(project_root))
+        os.replace(sentinel + ".tmp", sentinel)
+    except OSError:
+        pass
+
+HELP_TEXT = """VEXIS-1.2 AI Agent Runner
+==================================================
+Usage: python3 run.py "your instruction here"
+
+Features:
+  • Automatic virtual environment management
+  • Dependency installation
+  • Model selection (Ollama/Google API)
+  • Cross-platform compatibility
+
+Examples:
+  python3 run.py "Take a screenshot"
+  python3 run.py "Open browser and search for AI"
+
+Options:
+  --help, -h          Show this help
+  --debug             Enable debug mode
+  --check-env, -c     Run environment check
+  --check-models, -m  Check model availability
+  --system-check, -s  Run system check
+  --no-prompt         Use saved configuration
+"""
 
 def show_help():
     """Show help message"""
-    print("VEXIS-1.2 AI Agent Runner")
-    print("=" * 50)
-    print("Usage: python3 run.py \"your instruction here\"")
-    print()
-    print("Features:")
-    print("  • Automatic virtual environment management")
-    print("  • Dependency installation")
-    print("  • Model selection (Ollama/Google API)")
-    print("  • Cross-platform compatibility")
-    print()
-    print("Examples:")
-    print("  python3 run.py \"Take a screenshot\"")
-    print("  python3 run.py \"Open browser and search for AI\"")
-    print()
-    print("Options:")
-    print("  --help, -h          Show this help")
-    print("  --debug             Enable debug mode")
-    print("  --check-env, -c     Run environment check")
-    print("  --check-models, -m  Check model availability")
-    print("  --system-check, -s  Run system check")
-    print("  --no-prompt         Use saved configuration")
+    sys.stdout.write(HELP_TEXT)
 
-def bootstrap_environment(project_root: Path) -> bool:
+def parse_arguments(argv):
+    """Parse runner options, returning them with the remaining instruction words"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--help", "-h", action="store_true")
+    parser.add_argument("--debug", action="store_true")
+    parser.add_argument("--check-env", "-c", action="store_true")
+    parser.add_argument("--fix", action="store_true")
+    parser.add_argument("--check-models", "-m", action="store_true")
+    parser.add_argument("--install", action="store_true")
+    parser.add_argument("--system-check", "-s", action="store_true")
+    parser.add_argument("--no-prompt", action="store_true")
+    parser.add_argument(VENV_RESTART_FLAG, dest="venv_restarted", action="store_true")
+    
+    args, rest = parser.parse_known_args(argv)
+    # Unrecognized long options are ignored rather than treated as instruction text
+    instruction = " ".join(arg for arg in rest if not arg.startswith("--"))
+    return args, instruction
+
+def bootstrap_environment(project_root: "Path", venv_manager=None) -> bool:
     """Bootstrap the environment - create venv and install dependencies with user consent"""
     # Import here to avoid import errors before venv setup
-    from ai_agent.utils.venv_manager import VirtualEnvManager
     from ai_agent.utils.dependency_installer import DependencyInstaller
     
     print("Bootstrapping environment...")
     
-    venv_manager = VirtualEnvManager(project_root)
+    if venv_manager is None:
+        from ai_agent.utils.venv_manager import VirtualEnvManager
+        venv_manager = VirtualEnvManager(project_root)
     installer = DependencyInstaller(venv_manager)
     
     if not venv_manager.check_prerequisites():
@@ -63,19 +115,28 @@ def bootstrap_environment(project_root: Path) -> bool:
         print("Dependency installation cancelled or failed.")
         return False
     
+    _write_deps_sentinel(project_root)
     print("✓ Environment bootstrap complete")
     return True
 
 def main():
     """Main entry point"""
-    project_root = Path(__file__).parent
-    
-    # Handle help and check flags first
+    # Handle help before any path or import work
     if "--help" in sys.argv or "-h" in sys.argv:
         show_help()
         sys.exit(0)
     
-    if "--check-env" in sys.argv or "-c" in sys.argv:
+    args, instruction = parse_arguments(sys.argv[1:])
+    
+    # Add src to Python path for imports unless the package is already installed
+    import importlib.util
+    if importlib.util.find_spec("ai_agent") is None:
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+    
+    from pathlib import Path
+    project_root = Path(__file__).parent
+    
+    if args.check_env:
         try:
             from ai_agent.utils.environment_detector import detect_and_plan
             env_info, executor = detect_and_plan()
@@ -85,27 +146,27 @@ def main():
             print(f"  Cloud Model Support: {'✓ Yes' if env_info.can_use_cloud_models else '✗ No'}")
             print(f"  Recommended Provider: {env_info.recommended_provider}")
             
-            if "--fix" in sys.argv:
+            if args.fix:
                 print("\n🔧 Fix mode enabled - executing setup steps")
                 executor.execute_plan(interactive=True)
         except ImportError as e:
             print(f"Environment check not available: {e}")
         sys.exit(0)
     
-    if "--check-models" in sys.argv or "-m" in sys.argv:
+    if args.check_models:
         try:
             from check_models import ModelChecker
             checker = ModelChecker()
             results = checker.check_all_models()
             checker.display_results(results)
             
-            if "--install" in sys.argv:
+            if args.install:
                 checker.install_missing_models(results)
         except ImportError as e:
             print(f"Model check not available: {e}")
         sys.exit(0)
     
-    if "--system-check" in sys.argv or "-s" in sys.argv:
+    if args.system_check:
         try:
             from system_check import SystemChecker
             checker = SystemChecker()
@@ -115,76 +176,74 @@ def main():
             print(f"System check not available: {e}")
         sys.exit(0)
     
+    # Handle virtual environment; the prefix test needs no imports on the common in-venv path
+    in_venv = (
+        hasattr(sys, 'real_prefix') or
+        sys.prefix != getattr(sys, 'base_prefix', sys.prefix) or
+        os.getenv('VIRTUAL_ENV') is not None
+    )
+    if args.venv_restarted:
+        sys.argv.remove(VENV_RESTART_FLAG)
+        print("✓ Running in virtual environment")
+    elif in_venv:
+        print("✓ Already in virtual environment")
+    else:
+        from ai_agent.utils.venv_manager import VirtualEnvManager
+        venv_manager = VirtualEnvManager(project_root)
+        
+        venv_python = venv_manager.get_venv_python_path()
+        if venv_python and _deps_sentinel_valid(project_root):
+            # Bootstrapped against these manifests already; skip the probe run
+            print("✓ Dependency cache hit, restarting in virtual environment...")
+            if venv_manager.restart_in_venv(sys.argv[1:], str(__file__)):
+                return
+            # Restart failed; fall through to the probe and bootstrap below
+        if venv_python and venv_manager.is_venv_python_working():
+            print("Virtual environment found, restarting...")
+            venv_manager.restart_in_venv(sys.argv[1:], str(__file__))
+            return
+        
+        if not bootstrap_environment(project_root, venv_manager):
+            print("Failed to bootstrap environment")
+            sys.exit(1)
+        
+        print("Restarting in new virtual environment...")
+        venv_manager.restart_in_venv(sys.argv[1:], str(__file__))
+        return
+    
     # Initialize managers after environment is ready
     try:
-        from ai_agent.utils.venv_manager import VirtualEnvManager
-        from ai_agent.utils.dependency_installer import DependencyInstaller
         from ai_agent.utils.config_manager import ConfigManager
-        
-        venv_manager = VirtualEnvManager(project_root)
-        installer = DependencyInstaller(venv_manager)
         config_manager = ConfigManager()
     except ImportError as e:
         print(f"Failed to import required modules: {e}")
         print("Running environment bootstrap...")
-        if not bootstrap_environment(project_root):
+        from ai_agent.utils.venv_manager import VirtualEnvManager
+        venv_manager = VirtualEnvManager(project_root)
+        if not bootstrap_environment(project_root, venv_manager):
             print("Failed to bootstrap environment")
             sys.exit(1)
         # After successful bootstrap, restart in venv
-        from ai_agent.utils.venv_manager import VirtualEnvManager
-        venv_manager = VirtualEnvManager(project_root)
         print("Restarting in new virtual environment...")
         venv_manager.restart_in_venv(sys.argv[1:], str(__file__))
         return
     
-    # Handle virtual environment
-    if VENV_RESTART_FLAG in sys.argv:
-        sys.argv.remove(VENV_RESTART_FLAG)
-        print("✓ Running in virtual environment")
-    else:
-        if not venv_manager.is_in_virtual_environment():
-            venv_python = venv_manager.get_venv_python_path()
-            if venv_python:
-                try:
-                    import subprocess
-                    result = subprocess.run([venv_python, "--version"], 
-                                          capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        print("Virtual environment found, restarting...")
-                        venv_manager.restart_in_venv(sys.argv[1:], str(__file__))
-                        return
-                except Exception:
-                    pass
-            
-            if not bootstrap_environment(project_root):
-                print("Failed to bootstrap environment")
-                sys.exit(1)
-            
-            print("Restarting in new virtual environment...")
-            venv_manager.restart_in_venv(sys.argv[1:], str(__file__))
-            return
-        else:
-            print("✓ Already in virtual environment")
-    
     # Add navigation module to path
     nav_dir = project_root / "yellow-highlight-navigation"
     if nav_dir.exists():
         sys.path.insert(0, str(nav_dir))
     
     # Validate arguments
-    instruction_args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
-    instruction = " ".join(instruction_args)
-    
     if not instruction:
         print("Usage: python3 run.py \"your instruction here\"")
         print("Example: python3 run.py \"Take a screenshot\"")
         print("Use --help for more options")
         sys.exit(1)
     
-    debug_mode = "--debug" in sys.argv
+    debug_mode = args.debug
     
     # Configure provider
-    if "--no-prompt" not in sys.argv:
+    if not args.no_prompt:
         selected_provider = config_manager.select_provider()
         if selected_provider:
             config_manager.show_config_summary(selected_provider)
@@ -198,8 +257,8 @@ def main():
     try:
         from ai_agent.user_interface.two_phase_app import TwoPhaseAIAgent
         
-        config_path = project_root / "config.yaml"
-        agent = TwoPhaseAIAgent(config_path=str(config_path) if config_path.exists() else None)
+        # A missing config.yaml falls back to defaults when the loader opens it
+        agent = TwoPhaseAIAgent(config_path=str(project_root / "config.yaml"))
         
         # Update configuration with selected provider
         if hasattr(agent, 'engine') and hasattr(agent.engine, 'model_runner'):
@@ -11,13 +11,29 @@ __author__ = "AI Agent Team"
 __email__ = "contact@vexis-1.2.org"
 __description__ = "Vision-based AI agent for GUI automation"
 
-# Import core components for easy access
-from .core_processing.command_parser import CommandParser
-from .core_processing.two_phase_engine import TwoPhaseEngine
-from .platform_abstraction.screenshot_capture import ScreenshotCapture
-from .platform_abstraction.gui_automation import GUIAutomation
-from .external_integration.vision_api_client import VisionAPIClient
-from .external_integration.model_runner import ModelRunner
+import importlib
+
+# Core components for easy access, imported on first use so that light entry
+# points (CLI --help, the utils helpers) do not load the whole engine stack
+_LAZY_IMPORTS = {
+    "CommandParser": ".core_processing.command_parser",
+    "TwoPhaseEngine": ".core_processing.two_phase_engine",
+    "ScreenshotCapture": ".platform_abstraction.screenshot_capture",
+    "GUIAutomation": ".platform_abstraction.gui_automation",
+    "VisionAPIClient": ".external_integration.vision_api_client",
+    "ModelRunner": ".external_integration.model_runner",
+}
+
+
+def __getattr__(name):
+    """Import core components on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "CommandParser", 
@@ -4,10 +4,17 @@ Command Parser for AI Agent System
 """
 
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Pattern
 from dataclasses import dataclass
 from enum import Enum
 
+# Prefer the linear-time RE2 engine when available; the command grammar is
+# regular (no backreferences), so both engines accept the same pattern
+try:
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
 from ..external_integration.model_runner import get_model_runner
 # Simple exception classes
 class CommandParsingError(Exception):
@@ -34,6 +41,8 @@ class CommandType(Enum):
 @dataclass
 class ParsedCommand:
     """Parsed command structure"""
+    __slots__ = ("type", "parameters", "raw_text")
+    
     type: CommandType
     parameters: Dict[str, Any]
     raw_text: str
@@ -41,57 +50,110 @@ class ParsedCommand:
 
 @dataclass
 class Coordinate:
-    """Coordinate structure"""
+    """Coordinate structure (range-checked by the parser before construction)"""
+    __slots__ = ("x", "y")
+    
     x: float
     y: float
     
-    def __post_init__(self):
-        # Validate coordinates are in normalized range (0.0-1.0)
-        if not (0.0 <= self.x <= 1.0):
-            raise ValidationError(f"Invalid x coordinate: {self.x}. Must be between 0.0 and 1.0")
-        if not (0.0 <= self.y <= 1.0):
-            raise ValidationError(f"Invalid y coordinate: {self.y}. Must be between 0.0 and 1.0")
-    
     def to_tuple(self) -> tuple:
         return (self.x, self.y)
 
 
+# Strict command grammar; each entry becomes a named group of the master pattern
+_COMMAND_GRAMMAR = (
+    (CommandType.CLICK, r'click\s*\(\s*([0-9]*\.?[0-9]+)\s*,\s*([0-9]*\.?[0-9]+)\s*\)'),
+    (CommandType.DOUBLE_CLICK, r'double_click\s*\(\s*([0-9]*\.?[0-9]+)\s*,\s*([0-9]*\.?[0-9]+)\s*\)'),
+    (CommandType.RIGHT_CLICK, r'right_click\s*\(\s*([0-9]*\.?[0-9]+)\s*,\s*([0-9]*\.?[0-9]+)\s*\)'),
+    (CommandType.TEXT, r'text\s*\(\s*["\']([^"\']*)["\']\s*\)'),
+    (CommandType.KEY, r'key\s*\(\s*["\']([^"\']*)["\']\s*\)'),
+    (CommandType.DRAG, r'drag\s*\(\s*([0-9]*\.?[0-9]+)\s*,\s*([0-9]*\.?[0-9]+)\s*,\s*([0-9]*\.?[0-9]+)\s*,\s*([0-9]*\.?[0-9]+)\s*\)'),
+    (CommandType.SCROLL, r'scroll\s*\(\s*["\']?(up|down|left|right)["\']?\s*,\s*([0-9]+)\s*\)'),
+    (CommandType.END, r'end\s*'),
+)
+
+# Accepted scroll arguments
+_SCROLL_DIRECTIONS = frozenset({"up", "down", "left", "right"})
+_SCROLL_AMOUNTS = frozenset(range(1, 11))
+
+# Whitespace runs collapsed to a single space during cleaning
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Conversational prefixes stripped before parsing, each at most once and in this order
+_POLITE_PREFIX_RE = re.compile(r'(?:please )?(?:can you )?(?:i want you to )?(?:now )?', re.IGNORECASE)
+
+# Leading command token -> command type, checked before any regex work
+_COMMAND_TOKENS = {command_type.value: command_type for command_type in CommandType}
+
+# Commands whose arguments are plain numeric coordinates, with their argument count
+_COORDINATE_ARG_COUNTS = {
+    CommandType.CLICK: 2,
+    CommandType.DOUBLE_CLICK: 2,
+    CommandType.RIGHT_CLICK: 2,
+    CommandType.DRAG: 4,
+}
+
+
+def _is_plain_number(text: str) -> bool:
+    """Check text against the grammar's unsigned decimal form ([0-9]*.?[0-9]+)"""
+    integer, dot, fraction = text.partition('.')
+    if dot:
+        return fraction.isascii() and fraction.isdigit() and (not integer or (integer.isascii() and integer.isdigit()))
+    return integer.isascii() and integer.isdigit()
+
+
+def _split_coordinate_args(arg_text: str, count: int) -> Optional[Tuple[str, ...]]:
+    """Split "x, y, ...)" into exactly count numeric arguments, or None if malformed"""
+    if not arg_text.endswith(')'):
+        return None
+    
+    args = tuple(part.strip() for part in arg_text[:-1].split(','))
+    if len(args) != count or not all(_is_plain_number(arg) for arg in args):
+        return None
+    
+    return args
+
+
 class CommandParser:
     """Simplified command parser for 2-Phase Vision-Only Architecture"""
     
     def __init__(self):
-        # Strict command patterns
-        self.command_patterns = self._initialize_strict_command_patterns()
-    
-    def _initialize_strict_command_patterns(self) -> Dict[CommandType, list]:
-        """Initialize strict command patterns for 2-Phase Architecture"""
-        return {
-            CommandType.CLICK: [
-                re.compile(r'^click\s*\(\s*([0-9]*\.?[0-9]+)\s*,\s*([0-9]*\.?[0-9]+)\s*\)$', re.IGNORECASE),
-            ],
-            CommandType.DOUBLE_CLICK: [
-                re.compile(r'^double_click\s*\(\s*([0-9]*\.?[0-9]+)\s*,\s*([0-9]*\.?[0-9]+)\s*\)$', re.IGNORECASE),
-            ],
-            CommandType.RIGHT_CLICK: [
-                re.compile(r'^right_click\s*\(\s*([0-9]*\.?[0-9]+)\s*,\s*([0-9]*\.?[0-9]+)\s*\)$', re.IGNORECASE),
-            ],
-            CommandType.TEXT: [
-                re.compile(r'^text\s*\(\s*["\']([^"\']*)["\']\s*\)$', re.IGNORECASE),
-            ],
-            CommandType.KEY: [
-                re.compile(r'^key\s*\(\s*["\']([^"\']*)["\']\s*\)$', re.IGNORECASE),
-            ],
-            CommandType.DRAG: [
-                re.compile(r'^drag\s*\(\s*([0-9]*\.?[0-9]+)\s*,\s*([0-9]*\.?[0-9]+)\s*,\s*([0-9]*\.?[0-9]+)\s*,\s*([0-9]*\.?[0-9]+)\s*\)$', re.IGNORECASE),
-            ],
-            CommandType.SCROLL: [
-                re.compile(r'^scroll\s*\(\s*["\']?(up|down|left|right)["\']?\s*,\s*([0-9]+)\s*\)$', re.IGNORECASE),
-            ],
-            CommandType.END: [
-                re.compile(r'^end\s*$', re.IGNORECASE),
-            ],
+        # Single master pattern covering the strict command set
+        self._master_re, self._dispatch = self._initialize_strict_command_patterns()
+        
+        # Parameter builders per command type
+        self._builders = {
+            CommandType.CLICK: self._build_click_parameters,
+            CommandType.DOUBLE_CLICK: self._build_click_parameters,
+            CommandType.RIGHT_CLICK: self._build_click_parameters,
+            CommandType.TEXT: self._build_text_parameters,
+            CommandType.KEY: self._build_key_parameters,
+            CommandType.DRAG: self._build_drag_parameters,
+            CommandType.SCROLL: self._build_scroll_parameters,
+            CommandType.END: self._build_end_parameters,
         }
     
+    def _initialize_strict_command_patterns(self) -> Tuple[Pattern, Dict[str, Tuple[CommandType, int, int]]]:
+        """Compile the strict command set into one alternation of named groups
+        
+        Returns the master pattern and a table mapping each group name to its
+        command type, the index of its first argument group and the argument count.
+        """
+        # Inline (?i) flag keeps the pattern portable across re and re2; anchoring
+        # comes from fullmatch() rather than ^/$ in the pattern
+        master_re = _regex_engine.compile(
+            r'(?i)(?:' + '|'.join(
+                f'(?P<{command_type.value}>{pattern})' for command_type, pattern in _COMMAND_GRAMMAR
+            ) + r')'
+        )
+        
+        dispatch = {}
+        for command_type, pattern in _COMMAND_GRAMMAR:
+            group_index = master_re.groupindex[command_type.value]
+            dispatch[command_type.value] = (command_type, group_index, re.compile(pattern).groups)
+        
+        return master_re, dispatch
+    
     
     def parse_command(self, command_text: str, screenshot: Optional[bytes] = None, context: Optional[Dict[str, Any]] = None) -> ParsedCommand:
         """Parse command text into structured command using AI vision analysis"""
@@ -99,31 +161,16 @@ class CommandParser:
         if command_text is None:
             raise ValidationError("Command text cannot be None", "command_text", command_text)
         
-        if not command_text or not command_text.strip():
+        stripped_text = command_text.strip()
+        if not stripped_text:
             raise ValidationError("Command text cannot be empty", "command_text", command_text)
         
         try:
-            # Apply rule: Read from second line downwards
-            lines = command_text.strip().split('\n')
-            if len(lines) >= 2:
-                # Extract second line from bottom (click/text command)
-                second_from_bottom = lines[-2].strip()
-                # Extract final line (save command)
-                final_line = lines[-1].strip()
-                
-                # Parse the main command from second line from bottom
-                cleaned_command = self._clean_command_text(second_from_bottom)
-                parsed = self._parse_with_patterns(cleaned_command)
-                
-                if parsed:
-                    return parsed
-            else:
-                # Fallback to original parsing for single line commands
-                cleaned_command = self._clean_command_text(command_text)
-                parsed = self._parse_with_patterns(cleaned_command)
-                
-                if parsed:
-                    return parsed
+            cleaned_command = self._select_command_line(stripped_text)
+            parsed = self._parse_with_patterns(cleaned_command)
+            
+            if parsed:
+                return parsed
             
             # For completely invalid commands, raise validation error
             raise ValidationError(f"Invalid command format: {command_text}", "command_text", command_text)
@@ -135,19 +182,44 @@ class CommandParser:
             # For other exceptions, fail the command
             raise CommandParsingError(f"Failed to parse command: {command_text}")
     
+    def parse_many(self, command_texts: List[str]) -> List[Optional[ParsedCommand]]:
+        """Parse a batch of commands, e.g. when replaying recorded sessions
+        
+        Each entry goes through the same path as parse_command. Entries that
+        fail to parse come back as None instead of raising.
+        """
+        results: List[Optional[ParsedCommand]] = []
+        for command_text in command_texts:
+            stripped_text = command_text.strip() if command_text else ''
+            if not stripped_text:
+                results.append(None)
+                continue
+            try:
+                results.append(self._parse_with_patterns(self._select_command_line(stripped_text)))
+            except ValidationError:
+                results.append(None)
+        
+        return results
+    
+    def _select_command_line(self, stripped_text: str) -> str:
+        """Select and clean the command line of an already stripped model response
+        
+        Multi-line responses carry the command on the second line from the
+        bottom, followed by the save command on the final line.
+        """
+        lines = stripped_text.split('\n')
+        if len(lines) >= 2:
+            return self._clean_command_text(lines[-2].strip())
+        return self._clean_command_text(stripped_text)
+    
     def _clean_command_text(self, command_text: str) -> str:
         """Clean and normalize command text"""
         if not command_text:
             raise ValidationError("Command text cannot be empty", "command_text", command_text)
         
-        # Remove extra whitespace but preserve structure for validation
-        cleaned = ' '.join(command_text.split())
-        
-        # Remove common prefixes
-        prefixes_to_remove = ["please ", "can you ", "i want you to ", "now "]
-        for prefix in prefixes_to_remove:
-            if cleaned.lower().startswith(prefix):
-                cleaned = cleaned[len(prefix):]
+        # Collapse whitespace runs, then drop common conversational prefixes
+        cleaned = _WHITESPACE_RE.sub(' ', command_text).strip()
+        cleaned = cleaned[_POLITE_PREFIX_RE.match(cleaned).end():]
         
         final_cleaned = cleaned.strip()
         
@@ -159,70 +231,85 @@ class CommandParser:
     
         
     def _parse_with_patterns(self, command_text: str) -> Optional[ParsedCommand]:
-        """Parse command using strict regex patterns"""
-        command_lower = command_text.lower()
+        """Parse command using a leading-token lookup, then the strict master pattern"""
+        head, _, arg_text = command_text.partition('(')
+        command_type = _COMMAND_TOKENS.get(head.strip().lower())
+        if command_type is None:
+            return None
         
-        # Try each command type
-        for command_type, patterns in self.command_patterns.items():
-            for pattern in patterns:
-                match = pattern.match(command_text)
-                if match:
-                    return self._create_command_from_match(command_type, match, command_text)
+        # Coordinate commands are parsed directly; quoted and keyword forms use the regex
+        arg_count = _COORDINATE_ARG_COUNTS.get(command_type)
+        if arg_count is not None:
+            args = _split_coordinate_args(arg_text, arg_count)
+            if args is None:
+                return None
+            return self._create_command_from_match(command_type, args, command_text)
         
-        return None
+        match = self._master_re.fullmatch(command_text)
+        if not match:
+            return None
+        
+        command_type, group_index, arg_count = self._dispatch[match.lastgroup]
+        # groups() is zero-based, so the first argument group sits at group_index
+        args = match.groups()[group_index:group_index + arg_count]
+        return self._create_command_from_match(command_type, args, command_text)
     
-    def _create_command_from_match(self, command_type: CommandType, match: re.Match, raw_text: str) -> ParsedCommand:
-        """Create parsed command from regex match with strict validation"""
-        try:
-            parameters = {}
-            
-            if command_type in [CommandType.CLICK, CommandType.DOUBLE_CLICK, CommandType.RIGHT_CLICK]:
-                # Click commands: (x, y)
-                x, y = float(match.group(1)), float(match.group(2))
-                parameters = {"coordinates": Coordinate(x, y)}
-                
-            elif command_type == CommandType.TEXT:
-                # Text command: ("content")
-                text_content = match.group(1)
-                if not text_content:
-                    raise ValidationError("Text content cannot be empty")
-                parameters = {"text": text_content}
-                
-            elif command_type == CommandType.KEY:
-                # Key command: ("keys")
-                key_combo = match.group(1)
-                if not key_combo:
-                    raise ValidationError("Key combination cannot be empty")
-                parameters = {"keys": key_combo}
-                
-            elif command_type == CommandType.DRAG:
-                # Drag command: (start_x, start_y, end_x, end_y)
-                start_x, start_y = float(match.group(1)), float(match.group(2))
-                end_x, end_y = float(match.group(3)), float(match.group(4))
-                parameters = {
-                    "start": Coordinate(start_x, start_y),
-                    "end": Coordinate(end_x, end_y)
-                }
-                
-            elif command_type == CommandType.SCROLL:
-                # Scroll command: (direction, amount)
-                direction = match.group(1)
-                amount = int(match.group(2))
-                if direction not in ["up", "down", "left", "right"]:
-                    raise ValidationError(f"Invalid scroll direction: {direction}")
-                if not (1 <= amount <= 10):
-                    raise ValidationError(f"Invalid scroll amount: {amount}. Must be between 1 and 10")
-                parameters = {"direction": direction, "amount": amount}
-                
-            elif command_type == CommandType.END:
-                # END command: no parameters
-                parameters = {}
-            
-            return ParsedCommand(
-                type=command_type,
-                parameters=parameters,
-                raw_text=raw_text,
-            )
-            
-        except Exception as e:
+    def _create_command_from_match(self, command_type: CommandType, args: Tuple[str, ...], raw_text: str) -> Optional[ParsedCommand]:
+        """Create parsed command from matched arguments with strict validation
+        
+        Builders return None for arguments that fail validation, so malformed
+        input is rejected without raising and catching exceptions.
+        """
+        parameters = self._builders[command_type](args)
+        if parameters is None:
             return None
+        
+        return ParsedCommand(
+            type=command_type,
+            parameters=parameters,
+            raw_text=raw_text,
+        )
+    
+    def _build_click_parameters(self, args: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Click commands: (x, y)"""
+        x, y = float(args[0]), float(args[1])
+        if not (0.0 <= x <= 1.0 and 0.0 <= y <= 1.0):
+            return None
+        return {"coordinates": Coordinate(x, y)}
+    
+    def _build_text_parameters(self, args: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Text command: ("content")"""
+        text_content = args[0]
+        if not text_content:
+            return None
+        return {"text": text_content}
+    
+    def _build_key_parameters(self, args: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Key command: ("keys")"""
+        key_combo = args[0]
+        if not key_combo:
+            return None
+        return {"keys": key_combo}
+    
+    def _build_drag_parameters(self, args: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Drag command: (start_x, start_y, end_x, end_y)"""
+        start_x, start_y, end_x, end_y = map(float, args)
+        # Reject out-of-range drags with one combined test before building coordinates
+        if not (0.0 <= start_x <= 1.0 and 0.0 <= start_y <= 1.0 and 0.0 <= end_x <= 1.0 and 0.0 <= end_y <= 1.0):
+            return None
+        return {
+            "start": Coordinate(start_x, start_y),
+            "end": Coordinate(end_x, end_y),
+        }
+    
+    def _build_scroll_parameters(self, args: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Scroll command: (direction, amount)"""
+        direction = args[0]
+        amount = int(args[1])
+        if direction not in _SCROLL_DIRECTIONS or amount not in _SCROLL_AMOUNTS:
+            return None
+        return {"direction": direction, "amount": amount}
+    
+    def _build_end_parameters(self, args: Tuple[str, ...]) -> Dict[str, Any]:
+        """END command: no parameters"""
+        return {}
@@ -82,7 +82,7 @@ class TwoPhaseEngine:
         )
         
         self.screenshot_capture = ScreenshotCapture(
-            quality=self.config.get("screenshot_quality", 95),
+            quality=self.config.get("screenshot_quality"),
             format=self.config.get("screenshot_format", "PNG"),
         )
         
@@ -4,12 +4,16 @@ Zero-defect policy: simplified API communication with Ollama Cloud Models only
 """
 
 import base64
+import functools
+import hashlib
 import io
 import json
+import sys
 import time
 import uuid
-from typing import Optional, Dict, Any, List, Union, BinaryIO
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Union, BinaryIO, Iterator
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from datetime import datetime
 from enum import Enum
 
@@ -23,18 +27,72 @@ try:
 except ImportError:
     Image = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 from ..utils.exceptions import APIError, ValidationError
 from ..utils.logger import get_logger
 from ..utils.config import load_config
 
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__ instances
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Leading signatures of the image formats accepted by the providers
+_IMAGE_SIGNATURES = (
+    b"\x89PNG\r\n\x1a\n",  # PNG
+    b"\xff\xd8\xff",         # JPEG
+    b"GIF87a",
+    b"GIF89a",
+    b"BM",                    # BMP
+)
+
+
+def _has_image_signature(data: bytes) -> bool:
+    """Check the leading magic bytes of image data"""
+    if data.startswith(_IMAGE_SIGNATURES):
+        return True
+    # WebP: RIFF container with a WEBP form type
+    return data[:4] == b"RIFF" and data[8:12] == b"WEBP"
+
+
+@functools.lru_cache(maxsize=None)
+def _build_test_png() -> bytes:
+    """Encode the provider test image once; the bytes are immutable and shared"""
+    image = Image.new('RGB', (100, 100), color='red')
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def _image_digest(data: bytes) -> bytes:
+    """Fingerprint image data for cache keys (non-cryptographic when xxhash is available)"""
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.sha256(data).digest()
+
+
+def _encode_json_body(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload straight to UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
 class APIProvider(Enum):
     """Supported API providers"""
     OLLAMA = "ollama"
     GOOGLE = "google"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class APIResponse:
     """API response structure"""
     success: bool
@@ -47,7 +105,7 @@ class APIResponse:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class APIRequest:
     """API request structure"""
     prompt: str
@@ -62,10 +120,27 @@ class APIRequest:
 class VisionAPIClient:
     """Vision API client with Ollama and Google support"""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    # Seconds an Ollama availability probe result stays valid
+    AVAILABILITY_TTL = 30.0
+    # Requests at or below this temperature are treated as deterministic and cached
+    CACHE_MAX_TEMPERATURE = 0.2
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None, strict: bool = False):
         self.config = config or load_config().api.__dict__
         self.logger = get_logger("vision_api_client")
         
+        # Strict mode fully opens images with PIL instead of checking magic bytes
+        self.strict = strict
+        
+        # Cached Ollama availability probe
+        self._ollama_available = False
+        self._ollama_checked_at: Optional[float] = None
+        
+        # Opt-in LRU cache of successful responses to deterministic requests (0 disables).
+        # Off by default: a repeated prompt on an unchanged screen usually needs a fresh answer
+        self._response_cache: "OrderedDict[tuple, APIResponse]" = OrderedDict()
+        self._response_cache_size = self.config.get("response_cache_size", 0)
+        
         # Initialize providers
         self.ollama_provider = OllamaProvider(self.config)
         
@@ -91,14 +166,20 @@ class VisionAPIClient:
     
     
     def _test_ollama_availability(self) -> bool:
-        """Test if Ollama is available"""
+        """Test if Ollama is available (result cached for AVAILABILITY_TTL seconds)"""
+        now = time.monotonic()
+        if self._ollama_checked_at is not None and now - self._ollama_checked_at < self.AVAILABILITY_TTL:
+            return self._ollama_available
+        
         try:
-            import requests
-            local_endpoint: str = "http://localhost:11434"
-            response = requests.get(f"{local_endpoint}/api/tags", timeout=10)
-            return response.status_code == 200
+            response = self.ollama_provider.session.get(f"{self.ollama_provider.endpoint}/api/tags", timeout=10)
+            available = response.status_code == 200
         except:
-            return False
+            available = False
+        
+        self._ollama_available = available
+        self._ollama_checked_at = now
+        return available
     
     def analyze_image(self, request: APIRequest) -> APIResponse:
         """Analyze image using the specified or current provider"""
@@ -117,6 +198,12 @@ class VisionAPIClient:
             # Use current provider
             provider = self.current_provider
         
+        cache_key = self._response_cache_key(request, provider)
+        if cache_key is not None and cache_key in self._response_cache:
+            self._response_cache.move_to_end(cache_key)
+            self.logger.debug(f"Using cached {provider.name} response", model=request.model or provider.default_model)
+            return replace(self._response_cache[cache_key], latency=time.time() - start_time)
+        
         try:
             self.logger.debug(
                 f"Using {provider.name} for vision analysis",
@@ -128,6 +215,12 @@ class VisionAPIClient:
             latency = time.time() - start_time
             response.latency = latency
             
+            if cache_key is not None and response.success:
+                # Store a copy so the caller's edits to this response never reach later hits
+                self._response_cache[cache_key] = replace(response)
+                if len(self._response_cache) > self._response_cache_size:
+                    self._response_cache.popitem(last=False)
+            
             self.logger.info(
                 f"{provider.name} image analysis successful",
                 model=response.model,
@@ -153,6 +246,20 @@ class VisionAPIClient:
                 error=error_msg,
             )
     
+    def _response_cache_key(self, request: APIRequest, provider) -> Optional[tuple]:
+        """Build the response cache key, or None if the request should not be cached"""
+        if self._response_cache_size <= 0 or request.temperature > self.CACHE_MAX_TEMPERATURE:
+            return None
+        
+        return (
+            provider.name,
+            request.model or provider.default_model,
+            _image_digest(request.image_data or b""),
+            request.prompt,
+            round(request.temperature, 3),
+            request.max_tokens,
+        )
+    
     def _validate_request(self, request: APIRequest):
         """Validate API request"""
         if not request.prompt:
@@ -166,10 +273,13 @@ class VisionAPIClient:
                 raise ValidationError("Image too large", "image_data", len(request.image_data))
             
             # Validate image format
-            try:
-                Image.open(io.BytesIO(request.image_data))
-            except Exception as e:
-                raise ValidationError(f"Invalid image format: {e}", "image_data", "format_error")
+            if self.strict:
+                try:
+                    Image.open(io.BytesIO(request.image_data))
+                except Exception as e:
+                    raise ValidationError(f"Invalid image format: {e}", "image_data", "format_error")
+            elif not _has_image_signature(request.image_data):
+                raise ValidationError("Invalid image format: unrecognized image signature", "image_data", "format_error")
         
         if request.max_tokens < 1 or request.max_tokens > 7000:
             raise ValidationError("Invalid max_tokens", "max_tokens", request.max_tokens)
@@ -192,59 +302,43 @@ class VisionAPIClient:
     
     def test_providers(self) -> Dict[str, bool]:
         """Test available providers"""
-        results = {}
-        
-        # Test Ollama
-        try:
-            test_request = APIRequest(
-                prompt="Describe this image briefly.",
-                image_data=self._create_test_image(),
-                max_tokens=50,
-                temperature=0.1,
-            )
-            
-            response = self.ollama_provider.analyze_image(test_request)
-            results["ollama"] = response.success
-            
-            if response.success:
-                self.logger.info("Ollama provider test passed")
-            else:
-                self.logger.warning("Ollama provider test failed", error=response.error)
-                
-        except Exception as e:
-            results["ollama"] = False
-            self.logger.warning("Ollama provider test failed", error=str(e))
+        test_request = APIRequest(
+            prompt="Describe this image briefly.",
+            image_data=self._create_test_image(),
+            max_tokens=50,
+            temperature=0.1,
+        )
         
-        # Test Google if available
+        providers = [self.ollama_provider]
         if self.google_provider:
+            providers.append(self.google_provider)
+        
+        results = {}
+        for provider in providers:
+            # Skip the inference round trip when the Ollama server is known to be down
+            if provider is self.ollama_provider and not self._test_ollama_availability():
+                results[provider.name] = False
+                self.logger.warning("Ollama provider test failed", error="Ollama server not reachable")
+                continue
+            
             try:
-                test_request = APIRequest(
-                    prompt="Describe this image briefly.",
-                    image_data=self._create_test_image(),
-                    max_tokens=50,
-                    temperature=0.1,
-                )
-                
-                response = self.google_provider.analyze_image(test_request)
-                results["google"] = response.success
+                response = provider.analyze_image(test_request)
+                results[provider.name] = response.success
                 
                 if response.success:
-                    self.logger.info("Google provider test passed")
+                    self.logger.info(f"{provider.name.capitalize()} provider test passed")
                 else:
-                    self.logger.warning("Google provider test failed", error=response.error)
+                    self.logger.warning(f"{provider.name.capitalize()} provider test failed", error=response.error)
                     
             except Exception as e:
-                results["google"] = False
-                self.logger.warning("Google provider test failed", error=str(e))
+                results[provider.name] = False
+                self.logger.warning(f"{provider.name.capitalize()} provider test failed", error=str(e))
         
         return results
     
     def _create_test_image(self) -> bytes:
         """Create a simple test image"""
-        image = Image.new('RGB', (100, 100), color='red')
-        buffer = io.BytesIO()
-        image.save(buffer, format='PNG')
-        return buffer.getvalue()
+        return _build_test_png()
     
 
 
@@ -318,6 +412,23 @@ class OllamaProvider:
         self.max_retries = config.get("max_retries", 3)
         self.retry_delay = config.get("retry_delay", 1.0)
         self.endpoint = config.get("local_endpoint", "http://localhost:11434")
+        self.session = self._create_session()
+    
+    # Images larger than this (bytes) are streamed instead of embedded in memory
+    STREAM_THRESHOLD = 1_000_000
+    # Raw bytes per streamed chunk; a multiple of 3 so base64 chunks concatenate cleanly
+    STREAM_CHUNK_SIZE = 48 * 1024
+    
+    def _create_session(self):
+        """Create a keep-alive HTTP session reused across requests"""
+        if requests is None:
+            return None
+        
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
     
     @property
     def name(self) -> str:
@@ -330,8 +441,8 @@ class OllamaProvider:
     def analyze_image(self, request: APIRequest) -> APIResponse:
         """Analyze image using Ollama API (supports both local and cloud models)"""
         try:
-            import requests
-            import base64
+            if self.session is None:
+                raise ImportError("requests is required for the Ollama provider")
             
             # Prepare the request payload for /api/chat endpoint
             # Add unique identifier to bypass caching
@@ -352,15 +463,22 @@ class OllamaProvider:
             }
             
             # Add image if provided (for vision models)
-            if request.image_data:
-                # Convert image to base64
-                image_base64 = base64.b64encode(request.image_data).decode('utf-8')
-                payload["messages"][0]["images"] = [image_base64]
+            if request.image_data and len(request.image_data) > self.STREAM_THRESHOLD:
+                # Large images are base64-encoded lazily while the body is sent chunked
+                body = self._stream_json_body(payload, request.image_data)
+            else:
+                if request.image_data:
+                    # Convert image to base64 (ASCII output, so the decode is a plain copy)
+                    image_base64 = base64.b64encode(request.image_data).decode('ascii')
+                    payload["messages"][0]["images"] = [image_base64]
+                body = _encode_json_body(payload)
             
-            # Make API call to /api/chat endpoint
-            response = requests.post(
+            # Make API call to /api/chat endpoint with a pre-encoded body so the
+            # base64 payload is serialized once instead of through requests' json=
+            response = self.session.post(
                 f"{self.endpoint}/api/chat",
-                json=payload,
+                data=body,
+                headers={"Content-Type": "application/json"},
                 timeout=self.timeout
             )
             
@@ -395,6 +513,26 @@ class OllamaProvider:
                 error=str(e),
             )
     
+    def _stream_json_body(self, payload: Dict[str, Any], image_data: bytes) -> Iterator[bytes]:
+        """Yield the chat request JSON with the image base64-encoded chunk by chunk
+        
+        requests sends a generator body with chunked transfer encoding, so peak
+        memory stays at one chunk rather than the whole encoded image.
+        """
+        # Build the envelope around the image ourselves instead of searching
+        # the serialized body, which may contain any text in the prompt
+        message = _encode_json_body(payload["messages"][0])
+        rest = _encode_json_body({key: value for key, value in payload.items() if key != "messages"})
+        head = b'{"messages":[' + message[:-1] + (b',' if len(message) > 2 else b'') + b'"images":["'
+        tail = b'"]}]' + (b',' + rest[1:] if len(rest) > 2 else b'}')
+        
+        yield head
+        view = memoryview(image_data)
+        for offset in range(0, len(view), self.STREAM_CHUNK_SIZE):
+            # Base64 output never needs JSON escaping
+            yield base64.b64encode(view[offset:offset + self.STREAM_CHUNK_SIZE])
+        yield tail
+    
     def _calculate_cost(self, model: str, tokens: Optional[int] = None) -> Optional[float]:
         """Calculate cost for Ollama (always free for local models)"""
         return 0.0
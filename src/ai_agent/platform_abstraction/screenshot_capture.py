@@ -5,27 +5,36 @@ Zero-defect policy: comprehensive capture with fallback mechanisms
 
 import os
 import io
+import logging
+import functools
+import shutil
+import struct
 import time
 import tempfile
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Optional, Dict, Any, Tuple, List, Union
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    from PIL import Image, ImageDraw, ImageFont, ImageStat
 except ImportError:
     Image = None
     ImageDraw = None
     ImageFont = None
+    ImageStat = None
 
 try:
-    import cv2
     import numpy as np
 except ImportError:
-    cv2 = None
     np = None
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
 from .platform_detector import get_system_info, get_platform_detector
 from ..utils.exceptions import ScreenshotError, PlatformError
 from ..utils.logger import get_logger
@@ -47,20 +56,210 @@ class ScreenshotMetadata:
     color_depth: int
     dpi: Optional[Tuple[int, int]] = None
     compression_ratio: Optional[float] = None
+    lossless: bool = False
+
+
+class _RawOutput(Enum):
+    """Output sentinel asking the capture methods for pixels instead of encoded bytes"""
+    RAW = "raw"
+
+
+_RAW_OUTPUT = _RawOutput.RAW
+
+# Where a capture goes: kept in memory (None), a file path, or raw pixels
+_OutputTarget = Union[str, _RawOutput, None]
+
+# What a capture hands back: encoded bytes, a pixel array in raw mode, or None once written to disk
+_CaptureData = Union[bytes, "np.ndarray", None]
+
+# Chroma subsampling names -> Pillow's JPEG subsampling values
+_JPEG_SUBSAMPLING = {"4:4:4": 0, "4:2:2": 1, "4:2:0": 2}
+
+# Configured format -> Pillow encoder name
+_PIL_FORMATS = {"PNG": "PNG", "JPEG": "JPEG", "WEBP": "WEBP", "WEBP_LOSSLESS": "WEBP"}
+
+# Formats that ignore the quality setting
+_LOSSLESS_FORMATS = frozenset({"PNG", "WEBP_LOSSLESS"})
+
+# Default quality for the lossy formats
+_DEFAULT_QUALITY = {"JPEG": 85, "WEBP": 95}
+
+# Dynamic quality bounds and the thumbnail stdev treated as fully detailed
+_DYNAMIC_QUALITY_RANGE = (70, 85)
+_DYNAMIC_QUALITY_STDEV = 64.0
+
+
+# PNG color type -> channels per pixel
+_PNG_COLOR_TYPE_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+
+def _parse_png_ihdr(data: bytes) -> Tuple[int, int, int, int]:
+    """Read (width, height, bit_depth, channels) from a PNG IHDR chunk without decoding pixels"""
+    # 8-byte signature, 4-byte chunk length, then the "IHDR" chunk type
+    if len(data) < 26 or data[:8] != b"\x89PNG\r\n\x1a\n" or data[12:16] != b"IHDR":
+        raise ScreenshotError("Invalid PNG header")
+    
+    width, height, bit_depth, color_type = struct.unpack(">IIBB", data[16:26])
+    channels = _PNG_COLOR_TYPE_CHANNELS.get(color_type)
+    if channels is None:
+        raise ScreenshotError(f"Unknown PNG color type: {color_type}")
+    
+    return width, height, bit_depth, channels
+
+
+# JPEG start-of-frame markers (SOF0-SOF15, minus DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _parse_jpeg_sof(data: bytes) -> Tuple[int, int, int]:
+    """Read (width, height, channels) from the first JPEG SOF segment"""
+    if data[:2] != b"\xff\xd8":
+        raise ScreenshotError("Invalid JPEG header")
+    
+    # Walk the marker segments until a start-of-frame shows up
+    offset = 2
+    while offset + 10 <= len(data):
+        if data[offset] != 0xFF:
+            raise ScreenshotError("Corrupt JPEG marker stream")
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            offset += 1
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            _, height, width, components = struct.unpack(">BHHB", data[offset + 4:offset + 10])
+            return width, height, components
+        segment_length = struct.unpack(">H", data[offset + 2:offset + 4])[0]
+        offset += 2 + segment_length
+    
+    raise ScreenshotError("JPEG start-of-frame not found")
+
+
+def _parse_webp_header(data: bytes) -> Tuple[int, int, int]:
+    """Read (width, height, channels) from a WebP VP8/VP8L/VP8X chunk header"""
+    if len(data) < 30 or data[:4] != b"RIFF" or data[8:12] != b"WEBP":
+        raise ScreenshotError("Invalid WebP header")
+    
+    chunk = data[12:16]
+    if chunk == b"VP8 ":
+        # Lossy: 14-bit dimensions follow the frame tag and start code
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF, 3
+    elif chunk == b"VP8L":
+        # Lossless: 14-bit width-1, 14-bit height-1, then the alpha hint
+        bits = struct.unpack("<I", data[21:25])[0]
+        width = (bits & 0x3FFF) + 1
+        height = ((bits >> 14) & 0x3FFF) + 1
+        return width, height, 4 if bits >> 28 & 1 else 3
+    elif chunk == b"VP8X":
+        # Extended: alpha flag, then 24-bit canvas width-1 and height-1
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return width, height, 4 if data[20] & 0x10 else 3
+    
+    raise ScreenshotError(f"Unknown WebP chunk: {chunk!r}")
+
+
+def _probe_image_header(data: bytes, format: str) -> Tuple[int, int, int]:
+    """Read (width, height, channels) from encoded image headers without decoding pixels"""
+    if format == "PNG":
+        width, height, _, channels = _parse_png_ihdr(data)
+        return width, height, channels
+    elif format == "JPEG":
+        return _parse_jpeg_sof(data)
+    elif format == "WEBP":
+        return _parse_webp_header(data)
+    
+    raise ScreenshotError(f"Unsupported format for header probe: {format}")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(os_name: str, font_size: int):
+    """Load the label font, falling back to system fonts and then Pillow's default"""
+    try:
+        return ImageFont.truetype("arial.ttf", font_size)
+    except (OSError, IOError):
+        try:
+            # Try system fonts
+            if os_name == "macos":
+                return ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
+            elif os_name == "windows":
+                return ImageFont.truetype("C:/Windows/Fonts/arial.ttf", font_size)
+            else:
+                return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
+        except (OSError, IOError):
+            return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=64)
+def _render_label_tile(label: str, font_size: int, color: str, background: str, padding: int, os_name: str):
+    """Rasterize a label once as an RGBA tile
+    
+    Returns the tile with the text's width and height. The tile origin sits
+    at the top-left corner of the padded background box.
+    """
+    font = _load_font(os_name, font_size)
+    
+    # Calculate text size
+    bbox = ImageDraw.Draw(Image.new("RGBA", (1, 1))).textbbox((0, 0), label, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    
+    # Large enough for the box and any glyph ink that overhangs it
+    tile = Image.new(
+        "RGBA",
+        (max(text_width, bbox[2]) + 2 * padding + 1, max(text_height, bbox[3]) + 2 * padding + 1),
+        (0, 0, 0, 0),
+    )
+    draw = ImageDraw.Draw(tile)
+    draw.rectangle([0, 0, text_width + 2 * padding, text_height + 2 * padding], fill=background)
+    draw.text((padding, padding), label, font=font, fill=color)
+    
+    return tile, text_width, text_height
 
 
 class ScreenshotCapture:
     """Cross-platform screenshot capture with fallback mechanisms"""
     
-    def __init__(self, quality: int = 95, format: str = "PNG"):
-        self.quality = quality
+    # Seconds a test_capture_methods result stays valid
+    AVAILABILITY_TTL = 60.0
+    
+    def __init__(
+        self,
+        quality: Optional[int] = None,
+        format: str = "PNG",
+        png_compress_level: int = 1,
+        chroma_subsampling: str = "4:2:0",
+        dynamic_quality: bool = False,
+    ):
         self.format = format.upper()
+        self._pil_format = _PIL_FORMATS.get(self.format)
+        self.lossless = self.format in _LOSSLESS_FORMATS
+        self.png_compress_level = png_compress_level
+        self.chroma_subsampling = chroma_subsampling
+        self.dynamic_quality = dynamic_quality
         self.logger = get_logger("screenshot_capture")
         
         # Validate format
-        if self.format not in ["PNG", "JPEG", "WEBP"]:
+        if self._pil_format is None:
             raise ScreenshotError(f"Unsupported format: {self.format}")
         
+        # Validate quality for the selected format
+        if self.lossless:
+            if quality is not None:
+                self.logger.warning(f"Quality is ignored for {self.format} screenshots", quality=quality)
+            quality = 95
+        elif quality is None:
+            quality = _DEFAULT_QUALITY[self.format]
+        elif not 1 <= quality <= 100:
+            raise ScreenshotError(f"Quality must be between 1 and 100 for {self.format}: {quality}")
+        self.quality = quality
+        
+        if self.format == "JPEG" and chroma_subsampling not in _JPEG_SUBSAMPLING:
+            raise ScreenshotError(f"Unsupported chroma subsampling: {chroma_subsampling}")
+        
+        # Encoder options, resolved once for every save
+        self._save_kwargs = self._build_save_kwargs()
+        
         # Get system information
         self.system_info = get_system_info()
         self.platform_detector = get_platform_detector()
@@ -68,6 +267,13 @@ class ScreenshotCapture:
         # Initialize capture methods in order of preference
         self._capture_methods = self._initialize_capture_methods()
         
+        # Index of the last method that worked, tried first on the next capture
+        self._preferred_idx: Optional[int] = None
+        
+        # Cached test_capture_methods result and when it was taken
+        self._method_available: Optional[Dict[str, bool]] = None
+        self._method_available_at = 0.0
+        
         self.logger.info(
             "Screenshot capture initialized",
             format=self.format,
@@ -76,6 +282,74 @@ class ScreenshotCapture:
             methods=[method.__name__ for method in self._capture_methods],
         )
     
+    def _build_save_kwargs(self) -> Dict[str, Any]:
+        """Build Pillow save options for the configured format"""
+        if self.format == "PNG":
+            # PNG ignores quality; zlib level is the real cost knob
+            return {"compress_level": self.png_compress_level, "optimize": False}
+        elif self.format == "WEBP_LOSSLESS":
+            # Under lossless, quality trades effort for size; 0 with method 0 is fastest
+            return {"lossless": True, "quality": 0, "method": 0}
+        elif self.format == "JPEG":
+            return {
+                "quality": self.quality,
+                "optimize": True,
+                "progressive": True,
+                "subsampling": _JPEG_SUBSAMPLING[self.chroma_subsampling],
+            }
+        else:
+            return {"quality": self.quality, "method": 4}
+    
+    def _pick_dynamic_quality(self, image) -> int:
+        """Pick a lossy quality from image detail, measured on a 32px thumbnail
+        
+        Busy images mask compression artifacts and take the low end of the
+        range; flat images such as text on plain backgrounds keep the high end.
+        """
+        thumbnail = image.resize((32, 32), Image.BOX).convert("L")
+        stdev = ImageStat.Stat(thumbnail).stddev[0]
+        low, high = _DYNAMIC_QUALITY_RANGE
+        detail = min(stdev / _DYNAMIC_QUALITY_STDEV, 1.0)
+        return round(high - detail * (high - low))
+    
+    def _encode_image(self, image, output_path: _OutputTarget = None) -> Tuple[_CaptureData, int]:
+        """Encode a PIL image in the configured format, returning (data, size)
+        
+        With an output path the encoder writes straight to the file and no
+        bytes are kept in memory. With _RAW_OUTPUT nothing is encoded and the
+        pixels come back as a read-only numpy array copied from the image.
+        """
+        if output_path is _RAW_OUTPUT:
+            image.load()
+            pixels = np.asarray(image)
+            return pixels, pixels.nbytes
+        
+        save_kwargs = self._save_kwargs
+        if self.dynamic_quality and not self.lossless:
+            save_kwargs = dict(save_kwargs, quality=self._pick_dynamic_quality(image))
+        
+        if output_path is None:
+            buffer = io.BytesIO()
+            image.save(buffer, format=self._pil_format, **save_kwargs)
+            image_data = buffer.getvalue()
+            return image_data, len(image_data)
+        
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            image.save(f, format=self._pil_format, **save_kwargs)
+            return None, f.tell()
+    
+    def _write_encoded(self, image_data: bytes, output_path: _OutputTarget = None) -> Tuple[_CaptureData, int]:
+        """Hand back already-encoded bytes, or write them out when an output path is given"""
+        if output_path is None:
+            return image_data, len(image_data)
+        if output_path is _RAW_OUTPUT:
+            return self._encode_image(Image.open(io.BytesIO(image_data)), _RAW_OUTPUT)
+        
+        self._save_screenshot(image_data, output_path)
+        return None, len(image_data)
+    
     def _initialize_capture_methods(self) -> List[callable]:
         """Initialize platform-specific capture methods"""
         methods = []
@@ -83,6 +357,7 @@ class ScreenshotCapture:
         if self.system_info.os_name == "macos":
             methods.extend([
                 self._capture_quartz,
+                self._capture_mss,
                 self._capture_pil,
                 self._capture_opencv,
                 self._capture_pyautogui,
@@ -90,12 +365,14 @@ class ScreenshotCapture:
         elif self.system_info.os_name == "windows":
             methods.extend([
                 self._capture_win32,
+                self._capture_mss,
                 self._capture_pil,
                 self._capture_opencv,
                 self._capture_pyautogui,
             ])
         elif self.system_info.os_name == "linux":
             methods.extend([
+                self._capture_mss,
                 self._capture_x11,
                 self._capture_wayland,
                 self._capture_pil,
@@ -112,48 +389,81 @@ class ScreenshotCapture:
         
         return methods
     
+    def _method_order(self) -> List[int]:
+        """Capture method indices to try, last successful method first"""
+        order = list(range(len(self._capture_methods)))
+        if self._preferred_idx is not None:
+            order.remove(self._preferred_idx)
+            order.insert(0, self._preferred_idx)
+        return order
+    
     def capture_screenshot(
         self,
         save_path: Optional[str] = None,
         display_index: int = 0,
-        include_metadata: bool = True
-    ) -> Tuple[bytes, ScreenshotMetadata]:
-        """Capture screenshot with automatic fallback"""
-        self.logger.info(
-            "Starting screenshot capture",
-            display_index=display_index,
-            save_path=save_path,
-        )
+        include_metadata: bool = True,
+        return_data: bool = True
+    ) -> Tuple[Optional[bytes], ScreenshotMetadata]:
+        """Capture screenshot with automatic fallback
         
+        With a save path and return_data=False the image is encoded straight
+        to disk and None is returned in place of the bytes.
+        """
+        output_path = save_path if save_path and not return_data else None
+        return self._capture_with_fallback(display_index, output_path, save_path)
+    
+    def capture_screenshot_raw(self, display_index: int = 0) -> Tuple[Any, ScreenshotMetadata]:
+        """Capture screenshot as a read-only numpy pixel array, skipping the encode step"""
+        if np is None:
+            raise ScreenshotError("NumPy is required for raw screenshot capture")
+        
+        pixels, metadata = self._capture_with_fallback(display_index, _RAW_OUTPUT)
+        metadata.format = "RAW"
+        return pixels, metadata
+    
+    def _capture_with_fallback(
+        self,
+        display_index: int,
+        output_path: _OutputTarget = None,
+        save_path: Optional[str] = None
+    ) -> Tuple[_CaptureData, ScreenshotMetadata]:
+        """Run the capture methods in order until one succeeds"""
         last_error = None
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         
-        # Try each capture method
-        for i, method in enumerate(self._capture_methods):
+        # Try each capture method, starting with the one that last succeeded
+        for i in self._method_order():
+            method = self._capture_methods[i]
             try:
-                self.logger.debug(
-                    f"Attempting capture method {i+1}/{len(self._capture_methods)}",
-                    method=method.__name__
-                )
+                if debug_enabled:
+                    self.logger.debug(
+                        f"Attempting capture method {i+1}/{len(self._capture_methods)}",
+                        method=method.__name__,
+                        display_index=display_index,
+                        save_path=save_path,
+                    )
                 
-                image_data, metadata = method(display_index)
+                image_data, metadata = method(display_index, output_path)
                 
                 # Basic validation - check if we got data
-                if not image_data:
+                if output_path is None and not image_data:
                     raise ScreenshotError("No image data captured")
                 
-                # Save to file if path provided
-                if save_path:
+                # Save to file if path provided and not already written; the bytes
+                # are written verbatim, so metadata.file_size already matches
+                if save_path and output_path is None:
                     self._save_screenshot(image_data, save_path)
-                    metadata.file_size = os.path.getsize(save_path)
-                
-                self.logger.info(
-                    "Screenshot captured successfully",
-                    method=method.__name__,
-                    width=metadata.width,
-                    height=metadata.height,
-                    file_size=len(image_data),
-                )
                 
+                if debug_enabled:
+                    self.logger.debug(
+                        "Screenshot captured successfully",
+                        method=method.__name__,
+                        width=metadata.width,
+                        height=metadata.height,
+                        file_size=metadata.file_size,
+                    )
+                
+                self._preferred_idx = i
                 return image_data, metadata
                 
             except Exception as e:
@@ -170,7 +480,7 @@ class ScreenshotCapture:
         self.logger.error(error_msg)
         raise ScreenshotError(error_msg, capture_method="all_failed")
     
-    def _capture_quartz(self, display_index: int) -> Tuple[bytes, ScreenshotMetadata]:
+    def _capture_quartz(self, display_index: int, output_path: _OutputTarget = None) -> Tuple[_CaptureData, ScreenshotMetadata]:
         """Capture using Quartz/CoreGraphics on macOS"""
         if self.system_info.os_name != "macos":
             raise ScreenshotError("Quartz capture only available on macOS")
@@ -211,34 +521,30 @@ class ScreenshotCapture:
                 provider = CGImageGetDataProvider(image_ref)
                 data = CGDataProviderCopyData(provider)
                 
-                # Convert to PIL Image
-                image = Image.frombytes(
-                    "RGBA",
+                # Convert to PIL Image; the BGRX raw mode drops alpha and swaps
+                # channels in one pass, so no separate RGBA -> RGB convert is needed
+                image = Image.frombuffer(
+                    "RGB",
                     (width, height),
                     data,
                     "raw",
-                    "BGRA",
+                    "BGRX",
                     CGImageGetBytesPerRow(image_ref),
                     1
                 )
                 
-                # Convert to RGB if needed
-                if image.mode != "RGB":
-                    image = image.convert("RGB")
-                
                 # Save to bytes
-                buffer = io.BytesIO()
-                image.save(buffer, format=self.format, quality=self.quality)
-                image_data = buffer.getvalue()
+                image_data, file_size = self._encode_image(image, output_path)
                 
                 # Create metadata
                 metadata = ScreenshotMetadata(
                     timestamp=datetime.now(),
                     width=width,
                     height=height,
-                    format=self.format,
+                    format=self._pil_format,
                     quality=self.quality,
-                    file_size=len(image_data),
+                    lossless=self.lossless,
+                    file_size=file_size,
                     capture_method="quartz",
                     platform=self.system_info.os_name,
                     scale_factor=self.system_info.scale_factor,
@@ -258,7 +564,7 @@ class ScreenshotCapture:
         except Exception as e:
             raise ScreenshotError(f"Quartz capture failed: {e}", capture_method="quartz")
     
-    def _capture_win32(self, display_index: int) -> Tuple[bytes, ScreenshotMetadata]:
+    def _capture_win32(self, display_index: int, output_path: _OutputTarget = None) -> Tuple[_CaptureData, ScreenshotMetadata]:
         """Capture using Win32 API on Windows"""
         if self.system_info.os_name != "windows":
             raise ScreenshotError("Win32 capture only available on Windows")
@@ -316,29 +622,30 @@ class ScreenshotCapture:
                 bmi.bmiHeader.biBitCount = 24
                 bmi.bmiHeader.biCompression = 0  # BI_RGB
                 
-                # Create buffer
-                buffer_size = width * height * 3
+                # Create buffer; DIB rows are padded to 4-byte boundaries
+                stride = (width * 3 + 3) & ~3
+                buffer_size = stride * height
                 buffer = ctypes.create_string_buffer(buffer_size)
                 
                 # Get bitmap bits
                 gdi32.GetDIBits(hdc_mem, hbitmap, 0, height, buffer, ctypes.byref(bmi), 0)
                 
-                # Convert to PIL Image
-                image = Image.frombytes("RGB", (width, height), buffer, "raw", "BGR", 0, 1)
+                # Convert to PIL Image directly over the ctypes buffer, which stays
+                # alive until the image has been encoded below
+                image = Image.frombuffer("RGB", (width, height), buffer, "raw", "BGR", stride, 1)
                 
                 # Save to bytes
-                img_buffer = io.BytesIO()
-                image.save(img_buffer, format=self.format, quality=self.quality)
-                image_data = img_buffer.getvalue()
+                image_data, file_size = self._encode_image(image, output_path)
                 
                 # Create metadata
                 metadata = ScreenshotMetadata(
                     timestamp=datetime.now(),
                     width=width,
                     height=height,
-                    format=self.format,
+                    format=self._pil_format,
                     quality=self.quality,
-                    file_size=len(image_data),
+                    lossless=self.lossless,
+                    file_size=file_size,
                     capture_method="win32",
                     platform=self.system_info.os_name,
                     scale_factor=self.system_info.scale_factor,
@@ -358,7 +665,44 @@ class ScreenshotCapture:
         except Exception as e:
             raise ScreenshotError(f"Win32 capture failed: {e}", capture_method="win32")
     
-    def _capture_x11(self, display_index: int) -> Tuple[bytes, ScreenshotMetadata]:
+    def _capture_mss(self, display_index: int, output_path: _OutputTarget = None) -> Tuple[_CaptureData, ScreenshotMetadata]:
+        """Capture using mss (MIT-SHM on X11, CoreGraphics on macOS, BitBlt on Windows)"""
+        try:
+            import mss
+            
+            with mss.mss() as sct:
+                # monitors[0] is the combined virtual screen; physical displays start at 1
+                if display_index + 1 >= len(sct.monitors):
+                    raise ScreenshotError(f"Display index {display_index} out of range")
+                raw = sct.grab(sct.monitors[display_index + 1])
+            
+            # Decode the raw BGRA framebuffer straight to RGB, dropping alpha
+            image = Image.frombuffer("RGB", raw.size, raw.bgra, "raw", "BGRX", 0, 1)
+            
+            # Save to bytes
+            image_data, file_size = self._encode_image(image, output_path)
+            
+            metadata = ScreenshotMetadata(
+                timestamp=datetime.now(),
+                width=image.width,
+                height=image.height,
+                format=self._pil_format,
+                quality=self.quality,
+                lossless=self.lossless,
+                file_size=file_size,
+                capture_method="mss",
+                platform=self.system_info.os_name,
+                scale_factor=self.system_info.scale_factor,
+                display_index=display_index,
+                color_depth=len(image.getbands()) * 8,
+            )
+            
+            return image_data, metadata
+            
+        except Exception as e:
+            raise ScreenshotError(f"mss capture failed: {e}", capture_method="mss")
+    
+    def _capture_x11(self, display_index: int, output_path: _OutputTarget = None) -> Tuple[_CaptureData, ScreenshotMetadata]:
         """Capture using X11 on Linux"""
         try:
             import subprocess
@@ -381,7 +725,9 @@ class ScreenshotCapture:
                 # Convert using ImageMagick if available
                 try:
                     result = subprocess.run(
-                        ["convert", tmp_path, self.format + ":-"],
+                        ["convert", tmp_path]
+                        + (["-define", "webp:lossless=true"] if self.format == "WEBP_LOSSLESS" else [])
+                        + [self._pil_format + ":-"],
                         capture_output=True,
                         timeout=10
                     )
@@ -389,22 +735,24 @@ class ScreenshotCapture:
                     if result.returncode == 0:
                         image_data = result.stdout
                         
-                        # Get image info
-                        image = Image.open(io.BytesIO(image_data))
-                        width, height = image.size
+                        # Get image info from the encoded headers
+                        width, height, channels = _probe_image_header(image_data, self._pil_format)
+                        color_depth = channels * 8
+                        image_data, file_size = self._write_encoded(image_data, output_path)
                         
                         metadata = ScreenshotMetadata(
                             timestamp=datetime.now(),
                             width=width,
                             height=height,
-                            format=self.format,
+                            format=self._pil_format,
                             quality=self.quality,
-                            file_size=len(image_data),
+                            lossless=self.lossless,
+                            file_size=file_size,
                             capture_method="x11_imagemagick",
                             platform=self.system_info.os_name,
                             scale_factor=self.system_info.scale_factor,
                             display_index=display_index,
-                            color_depth=len(image.getbands()) * 8,
+                            color_depth=color_depth,
                         )
                         
                         return image_data, metadata
@@ -417,17 +765,17 @@ class ScreenshotCapture:
                 if image.mode != "RGB":
                     image = image.convert("RGB")
                 
-                buffer = io.BytesIO()
-                image.save(buffer, format=self.format, quality=self.quality)
-                image_data = buffer.getvalue()
+                # Save to bytes
+                image_data, file_size = self._encode_image(image, output_path)
                 
                 metadata = ScreenshotMetadata(
                     timestamp=datetime.now(),
                     width=image.width,
                     height=image.height,
-                    format=self.format,
+                    format=self._pil_format,
                     quality=self.quality,
-                    file_size=len(image_data),
+                    lossless=self.lossless,
+                    file_size=file_size,
                     capture_method="x11_pil",
                     platform=self.system_info.os_name,
                     scale_factor=self.system_info.scale_factor,
@@ -447,7 +795,7 @@ class ScreenshotCapture:
         except Exception as e:
             raise ScreenshotError(f"X11 capture failed: {e}", capture_method="x11")
     
-    def _capture_wayland(self, display_index: int) -> Tuple[bytes, ScreenshotMetadata]:
+    def _capture_wayland(self, display_index: int, output_path: _OutputTarget = None) -> Tuple[_CaptureData, ScreenshotMetadata]:
         """Capture using Wayland"""
         try:
             import subprocess
@@ -470,32 +818,36 @@ class ScreenshotCapture:
                 with open(tmp_path, "rb") as f:
                     image_data = f.read()
                 
-                # Convert to desired format if needed
-                if self.format != "PNG":
+                if self.format == "PNG":
+                    # grim already produced the requested format: keep its bytes
+                    # as-is and read image info from the PNG header alone
+                    width, height, bit_depth, channels = _parse_png_ihdr(image_data)
+                    color_depth = bit_depth * channels
+                    image_data, file_size = self._write_encoded(image_data, output_path)
+                else:
+                    # Convert to desired format, reusing the decoded image for its info
                     image = Image.open(io.BytesIO(image_data))
                     if image.mode != "RGB":
                         image = image.convert("RGB")
                     
-                    buffer = io.BytesIO()
-                    image.save(buffer, format=self.format, quality=self.quality)
-                    image_data = buffer.getvalue()
-                
-                # Get image info
-                image = Image.open(io.BytesIO(image_data))
-                width, height = image.size
+                    # Save to bytes
+                    image_data, file_size = self._encode_image(image, output_path)
+                    width, height = image.size
+                    color_depth = len(image.getbands()) * 8
                 
                 metadata = ScreenshotMetadata(
                     timestamp=datetime.now(),
                     width=width,
                     height=height,
-                    format=self.format,
+                    format=self._pil_format,
                     quality=self.quality,
-                    file_size=len(image_data),
+                    lossless=self.lossless,
+                    file_size=file_size,
                     capture_method="wayland_grim",
                     platform=self.system_info.os_name,
                     scale_factor=self.system_info.scale_factor,
                     display_index=display_index,
-                    color_depth=len(image.getbands()) * 8,
+                    color_depth=color_depth,
                 )
                 
                 return image_data, metadata
@@ -510,7 +862,7 @@ class ScreenshotCapture:
         except Exception as e:
             raise ScreenshotError(f"Wayland capture failed: {e}", capture_method="wayland")
     
-    def _capture_pil(self, display_index: int) -> Tuple[bytes, ScreenshotMetadata]:
+    def _capture_pil(self, display_index: int, output_path: _OutputTarget = None) -> Tuple[_CaptureData, ScreenshotMetadata]:
         """Capture using PIL ImageGrab"""
         try:
             from PIL import ImageGrab
@@ -522,17 +874,16 @@ class ScreenshotCapture:
                 image = image.convert("RGB")
             
             # Save to bytes
-            buffer = io.BytesIO()
-            image.save(buffer, format=self.format, quality=self.quality)
-            image_data = buffer.getvalue()
+            image_data, file_size = self._encode_image(image, output_path)
             
             metadata = ScreenshotMetadata(
                 timestamp=datetime.now(),
                 width=image.width,
                 height=image.height,
-                format=self.format,
+                format=self._pil_format,
                 quality=self.quality,
-                file_size=len(image_data),
+                lossless=self.lossless,
+                file_size=file_size,
                 capture_method="pil",
                 platform=self.system_info.os_name,
                 scale_factor=self.system_info.scale_factor,
@@ -545,7 +896,7 @@ class ScreenshotCapture:
         except Exception as e:
             raise ScreenshotError(f"PIL capture failed: {e}", capture_method="pil")
     
-    def _capture_opencv(self, display_index: int) -> Tuple[bytes, ScreenshotMetadata]:
+    def _capture_opencv(self, display_index: int, output_path: _OutputTarget = None) -> Tuple[_CaptureData, ScreenshotMetadata]:
         """Capture using OpenCV"""
         try:
             # Try different OpenCV methods
@@ -564,24 +915,23 @@ class ScreenshotCapture:
                 if not ret:
                     raise ScreenshotError("Failed to capture frame")
                 
-                # Convert BGR to RGB
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # Convert to PIL Image
-                image = Image.fromarray(frame_rgb)
+                # Wrap the BGR frame directly; Pillow's raw decoder swaps to RGB
+                # in the same pass instead of a separate cvtColor copy
+                frame = np.ascontiguousarray(frame)
+                height, width = frame.shape[:2]
+                image = Image.frombuffer("RGB", (width, height), frame, "raw", "BGR", frame.strides[0], 1)
                 
                 # Save to bytes
-                buffer = io.BytesIO()
-                image.save(buffer, format=self.format, quality=self.quality)
-                image_data = buffer.getvalue()
+                image_data, file_size = self._encode_image(image, output_path)
                 
                 metadata = ScreenshotMetadata(
                     timestamp=datetime.now(),
                     width=image.width,
                     height=image.height,
-                    format=self.format,
+                    format=self._pil_format,
                     quality=self.quality,
-                    file_size=len(image_data),
+                    lossless=self.lossless,
+                    file_size=file_size,
                     capture_method="opencv",
                     platform=self.system_info.os_name,
                     scale_factor=self.system_info.scale_factor,
@@ -597,7 +947,7 @@ class ScreenshotCapture:
         except Exception as e:
             raise ScreenshotError(f"OpenCV capture failed: {e}", capture_method="opencv")
     
-    def _capture_pyautogui(self, display_index: int) -> Tuple[bytes, ScreenshotMetadata]:
+    def _capture_pyautogui(self, display_index: int, output_path: _OutputTarget = None) -> Tuple[_CaptureData, ScreenshotMetadata]:
         """Capture using PyAutoGUI"""
         try:
             import pyautogui
@@ -609,17 +959,16 @@ class ScreenshotCapture:
                 screenshot = screenshot.convert("RGB")
             
             # Save to bytes
-            buffer = io.BytesIO()
-            screenshot.save(buffer, format=self.format, quality=self.quality)
-            image_data = buffer.getvalue()
+            image_data, file_size = self._encode_image(screenshot, output_path)
             
             metadata = ScreenshotMetadata(
                 timestamp=datetime.now(),
                 width=screenshot.width,
                 height=screenshot.height,
-                format=self.format,
+                format=self._pil_format,
                 quality=self.quality,
-                file_size=len(image_data),
+                lossless=self.lossless,
+                file_size=file_size,
                 capture_method="pyautogui",
                 platform=self.system_info.os_name,
                 scale_factor=self.system_info.scale_factor,
@@ -641,11 +990,12 @@ class ScreenshotCapture:
             with open(path, "wb") as f:
                 f.write(image_data)
                 
-            self.logger.info(
-                "Screenshot saved",
-                path=str(path),
-                size=len(image_data),
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Screenshot saved",
+                    path=str(path),
+                    size=len(image_data),
+                )
             
         except Exception as e:
             raise ScreenshotError(f"Failed to save screenshot: {e}")
@@ -661,38 +1011,18 @@ class ScreenshotCapture:
     ) -> bytes:
         """Add label to screenshot"""
         try:
-            # Load image
+            # Load image in its native mode; the label is composited as a tile
             image = Image.open(io.BytesIO(image_data))
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGB")
             
-            # Convert to RGBA if needed
-            if image.mode != "RGBA":
-                image = image.convert("RGBA")
-            
-            # Create drawing context
-            draw = ImageDraw.Draw(image)
-            
-            # Try to load font
-            try:
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except (OSError, IOError):
-                try:
-                    # Try system fonts
-                    if self.system_info.os_name == "macos":
-                        font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
-                    elif self.system_info.os_name == "windows":
-                        font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", font_size)
-                    else:
-                        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-                except (OSError, IOError):
-                    font = ImageFont.load_default()
-            
-            # Calculate text size
-            bbox = draw.textbbox((0, 0), label, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
+            # Render (or reuse) the label tile: background box with the text on it
+            padding = 10
+            tile, text_width, text_height = _render_label_tile(
+                label, font_size, color, background, padding, self.system_info.os_name
+            )
             
             # Calculate position
-            padding = 10
             if position == "top-left":
                 x, y = padding, padding
             elif position == "top-right":
@@ -706,23 +1036,15 @@ class ScreenshotCapture:
             else:
                 x, y = padding, padding
             
-            # Draw background rectangle
-            draw.rectangle(
-                [x - padding, y - padding, x + text_width + padding, y + text_height + padding],
-                fill=background
-            )
-            
-            # Draw text
-            draw.text((x, y), label, font=font, fill=color)
+            # Composite the tile using its own alpha as the mask
+            image.paste(tile, (x - padding, y - padding), tile)
             
-            # Convert back to original format
-            if image.mode == "RGBA" and self.format != "PNG":
+            # Only JPEG lacks an alpha channel; every other format keeps RGBA as-is
+            if image.mode == "RGBA" and self._pil_format == "JPEG":
                 image = image.convert("RGB")
             
             # Save to bytes
-            buffer = io.BytesIO()
-            image.save(buffer, format=self.format, quality=self.quality)
-            labeled_image_data = buffer.getvalue()
+            labeled_image_data, _ = self._encode_image(image)
             
             self.logger.info(
                 "Label added to screenshot",
@@ -741,17 +1063,59 @@ class ScreenshotCapture:
         """Get list of available capture methods"""
         return [method.__name__ for method in self._capture_methods]
     
+    def _probe_capture_method(self, name: str):
+        """Cheaply check that a capture method's backend is usable, raising if not"""
+        if name == "_capture_quartz":
+            from Quartz import CGDisplayBounds, CGMainDisplayID
+            CGDisplayBounds(CGMainDisplayID())
+        elif name == "_capture_win32":
+            import ctypes
+            if not ctypes.windll.user32.GetSystemMetrics(0):  # SM_CXSCREEN
+                raise ScreenshotError("Win32 reported no screen")
+        elif name == "_capture_mss":
+            import mss
+            with mss.mss():
+                pass
+        elif name == "_capture_x11":
+            if shutil.which("xwd") is None:
+                raise ScreenshotError("xwd not found")
+        elif name == "_capture_wayland":
+            if shutil.which("grim") is None:
+                raise ScreenshotError("grim not found")
+        elif name == "_capture_pil":
+            from PIL import ImageGrab
+        elif name == "_capture_opencv":
+            if cv2 is None:
+                raise ScreenshotError("OpenCV not available")
+            cap = cv2.VideoCapture(0)
+            try:
+                if not cap.isOpened():
+                    raise ScreenshotError("Failed to open camera/device for screenshot")
+            finally:
+                cap.release()
+        elif name == "_capture_pyautogui":
+            import pyautogui
+    
     def test_capture_methods(self) -> Dict[str, bool]:
-        """Test all capture methods and return results"""
+        """Check which capture methods are usable without taking screenshots
+        
+        Results are cached for AVAILABILITY_TTL seconds.
+        """
+        now = time.monotonic()
+        if self._method_available is not None and now - self._method_available_at < self.AVAILABILITY_TTL:
+            return dict(self._method_available)
+        
         results = {}
         
         for method in self._capture_methods:
             try:
-                method(0)
+                self._probe_capture_method(method.__name__)
                 results[method.__name__] = True
                 self.logger.info(f"Capture method test passed: {method.__name__}")
             except Exception as e:
                 results[method.__name__] = False
                 self.logger.warning(f"Capture method test failed: {method.__name__}", error=str(e))
         
-        return results
+        self._method_available = results
+        self._method_available_at = now
+        return dict(results)
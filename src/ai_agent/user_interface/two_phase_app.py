@@ -8,35 +8,33 @@ import sys
 import argparse
 import time
 import signal
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pathlib import Path
 
-from ..core_processing.two_phase_engine import TwoPhaseEngine, ExecutionPhase
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..utils.exceptions import AIAgentException
-from ..utils.logger import get_logger, setup_logging
-from ..utils.config import load_config
+from ..utils.logger import get_logger, setup_logging, ensure_parent_dir
+
+# The engine stack and config loader are imported where they are used, so
+# --help and argument errors do not pay for loading them
 
 
 class TwoPhaseAIAgent:
     """Two-Phase AI Agent implementing the revised architecture"""
     
     def __init__(self, config_path: Optional[str] = None):
+        from ..core_processing.two_phase_engine import TwoPhaseEngine
+        from ..utils.config import load_config
+        
         self.config = load_config(config_path) if config_path else load_config()
         self.logger = get_logger("two_phase_app")
         
         # Initialize two-phase engine
-        engine_config = {
-            "click_delay": getattr(self.config, 'click_delay', 0.1),
-            "typing_delay": getattr(self.config, 'typing_delay', 0.05),
-            "scroll_duration": getattr(self.config, 'scroll_duration', 0.5),
-            "drag_duration": getattr(self.config, 'drag_duration', 0.3),
-            "screenshot_quality": getattr(self.config, 'screenshot_quality', 95),
-            "screenshot_format": getattr(self.config, 'screenshot_format', 'PNG'),
-            "max_task_retries": getattr(self.config, 'max_task_retries', 3),
-            "max_command_retries": getattr(self.config, 'max_command_retries', 3),
-            "command_timeout": getattr(self.config, 'command_timeout', 30),
-            "task_timeout": getattr(self.config, 'task_timeout', 300),
-        }
+        engine_config = self.config.engine_config()
         
         self.engine = TwoPhaseEngine(engine_config)
         
@@ -48,6 +46,8 @@ class TwoPhaseAIAgent:
     
     def run(self, instruction: str, options: Dict[str, Any]) -> int:
         """Run AI Agent with instruction using two-phase execution"""
+        from ..core_processing.two_phase_engine import ExecutionPhase
+        
         try:
             self.logger.info(
                 "Starting Two-Phase AI Agent execution",
@@ -104,9 +104,9 @@ class TwoPhaseAIAgent:
         """Save execution results to file"""
         try:
             import json
+            from ..core_processing.two_phase_engine import ExecutionPhase
             
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            ensure_parent_dir(output_file)
             
             results = {
                 "instruction": execution_context.metadata.get("instruction"),
@@ -116,8 +116,18 @@ class TwoPhaseAIAgent:
                 "total_tasks": len(execution_context.task_list.tasks) if execution_context.task_list else 0,
             }
             
-            with open(output_path, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            # Serialize in one call and write once; json.dump would issue a
+            # write per token
+            if orjson is not None:
+                with open(output_file, 'wb', buffering=1 << 20) as f:
+                    f.write(orjson.dumps(
+                        results,
+                        default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    ))
+            else:
+                with open(output_file, 'w') as f:
+                    f.write(json.dumps(results, indent=2, default=str))
             
             self.logger.info(f"Results saved to: {output_file}")
             
@@ -250,23 +260,19 @@ def validate_arguments(args: argparse.Namespace) -> bool:
     
     # Check log file directory
     if args.log_file:
-        log_path = Path(args.log_file)
-        if not log_path.parent.exists():
-            try:
-                log_path.parent.mkdir(parents=True)
-            except Exception as e:
-                print(f"Error: Cannot create log directory: {e}", file=sys.stderr)
-                return False
+        try:
+            ensure_parent_dir(args.log_file)
+        except Exception as e:
+            print(f"Error: Cannot create log directory: {e}", file=sys.stderr)
+            return False
     
     # Check output file directory
     if args.output:
-        output_path = Path(args.output)
-        if not output_path.parent.exists():
-            try:
-                output_path.parent.mkdir(parents=True)
-            except Exception as e:
-                print(f"Error: Cannot create output directory: {e}", file=sys.stderr)
-                return False
+        try:
+            ensure_parent_dir(args.output)
+        except Exception as e:
+            print(f"Error: Cannot create output directory: {e}", file=sys.stderr)
+            return False
     
     # Validate timeout values
     if args.command_timeout <= 0:
@@ -288,8 +294,45 @@ def validate_arguments(args: argparse.Namespace) -> bool:
     return True
 
 
+def validate_config_only(config_path: Optional[str]) -> int:
+    """Load the configuration and report whether it is valid"""
+    from ..utils.config import load_config
+    
+    if config_path and not Path(config_path).exists():
+        print(f"Error: Configuration file not found: {config_path}", file=sys.stderr)
+        return 1
+    
+    try:
+        load_config(config_path)
+        print("Configuration validation passed")
+        return 0
+    except Exception as e:
+        print(f"Configuration validation failed: {e}", file=sys.stderr)
+        return 1
+
+
+def _sniff_validate_only(argv: List[str]) -> Optional[str]:
+    """Return the --config value if argv asks for --validate-only, else None
+    
+    Returns "" when --validate-only is given without --config.
+    """
+    if "--validate-only" not in argv or "-h" in argv or "--help" in argv:
+        return None
+    
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--config", type=str, default="")
+    args, _ = parser.parse_known_args(argv)
+    return args.config
+
+
 def main():
     """Main entry point for two-phase AI Agent"""
+    # --validate-only only needs --config: skip the full parser and the
+    # instruction/output checks that do not apply to it
+    config_path = _sniff_validate_only(sys.argv[1:])
+    if config_path is not None:
+        return validate_config_only(config_path or None)
+    
     # Parse arguments
     parser = create_two_phase_argument_parser()
     args = parser.parse_args()
@@ -298,15 +341,9 @@ def main():
     if not validate_arguments(args):
         sys.exit(1)
     
-    # Handle validate-only mode
+    # Handle validate-only mode (e.g. an abbreviated flag the sniffing missed)
     if args.validate_only:
-        try:
-            config = load_config(args.config)
-            print("Configuration validation passed")
-            return 0
-        except Exception as e:
-            print(f"Configuration validation failed: {e}", file=sys.stderr)
-            return 1
+        return validate_config_only(args.config)
     
     # Create Two-Phase AI Agent
     try:
@@ -2,10 +2,32 @@
 Utility functions for AI Agent System
 """
 
-from .logger import get_logger, setup_logging
-from .config import Config, load_config
-from .exceptions import AIAgentException, ValidationError, ExecutionError
-from .dependency_checker import DependencyChecker, check_dependencies
+import importlib
+
+# Helpers imported on first use so that entry points needing a single utils
+# module (run.py's venv bootstrap) do not load logging, config and YAML too
+_LAZY_IMPORTS = {
+    "get_logger": ".logger",
+    "setup_logging": ".logger",
+    "Config": ".config",
+    "load_config": ".config",
+    "AIAgentException": ".exceptions",
+    "ValidationError": ".exceptions",
+    "ExecutionError": ".exceptions",
+    "DependencyChecker": ".dependency_checker",
+    "check_dependencies": ".dependency_checker",
+}
+
+
+def __getattr__(name):
+    """Import utility helpers on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "get_logger",
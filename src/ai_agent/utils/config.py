@@ -8,6 +8,10 @@ try:
     import yaml
 except ImportError:
     yaml = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import json
 from typing import Dict, Any, Optional, Union
 from pathlib import Path
@@ -39,6 +43,7 @@ class APIConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
     preferred_provider: str = "ollama"  # "ollama" only
+    response_cache_size: int = 0  # Opt-in LRU of deterministic responses; 0 disables
 
 
 @dataclass
@@ -48,7 +53,7 @@ class GUIConfig:
     typing_delay: float = 0.05
     scroll_duration: float = 0.5
     drag_duration: float = 0.3
-    screenshot_quality: int = 95
+    screenshot_quality: Optional[int] = None  # None picks the format's default
     screenshot_format: str = "PNG"
 
 
@@ -88,6 +93,22 @@ class VerificationConfig:
     auto_regenerate: bool = True
 
 
+@dataclass
+class EngineConfig:
+    """Two-phase engine configuration"""
+    click_delay: float = 0.1
+    typing_delay: float = 0.05
+    scroll_duration: float = 0.5
+    drag_duration: float = 0.3
+    screenshot_quality: Optional[int] = None  # None picks the format's default
+    screenshot_format: str = "PNG"
+    max_task_retries: int = 3
+    max_command_retries: int = 3
+    command_timeout: int = 30
+    task_timeout: int = 300
+    max_rebuilds_per_session: int = 3
+
+
 @dataclass
 class Config:
     """Main configuration class"""
@@ -97,6 +118,7 @@ class Config:
     security: SecurityConfig = field(default_factory=SecurityConfig)
     performance: PerformanceConfig = field(default_factory=PerformanceConfig)
     verification: VerificationConfig = field(default_factory=VerificationConfig)
+    engine: EngineConfig = field(default_factory=EngineConfig)
     
     # Platform-specific settings
     platform: Dict[str, Any] = field(default_factory=dict)
@@ -120,6 +142,23 @@ class Config:
             return value
         except (AttributeError, KeyError):
             return default
+    
+    def engine_config(self) -> Dict[str, Any]:
+        """Settings passed to the two-phase engine"""
+        engine = self.engine
+        return {
+            "click_delay": engine.click_delay,
+            "typing_delay": engine.typing_delay,
+            "scroll_duration": engine.scroll_duration,
+            "drag_duration": engine.drag_duration,
+            "screenshot_quality": engine.screenshot_quality,
+            "screenshot_format": engine.screenshot_format,
+            "max_task_retries": engine.max_task_retries,
+            "max_command_retries": engine.max_command_retries,
+            "command_timeout": engine.command_timeout,
+            "task_timeout": engine.task_timeout,
+            "max_rebuilds_per_session": engine.max_rebuilds_per_session,
+        }
 
 
 class ConfigManager:
@@ -150,24 +189,32 @@ class ConfigManager:
             "verification": {"enabled": True, "confidence_threshold": 0.8},
         }
         
-        # Load from file if exists
-        if self.config_path and self.config_path.exists():
+        # Load from file if exists; opening directly saves a separate stat
+        if self.config_path:
             try:
-                if self.config_path.suffix.lower() in ['.yaml', '.yml']:
-                    with open(self.config_path, 'r') as f:
-                        file_config = yaml.safe_load(f)
-                elif self.config_path.suffix.lower() == '.json':
+                suffix = self.config_path.suffix.lower()
+                if suffix in ['.yaml', '.yml']:
+                    # Use the libyaml-backed loader when PyYAML was built with it
+                    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
                     with open(self.config_path, 'r') as f:
-                        file_config = json.load(f)
+                        file_config = yaml.load(f, Loader=loader)
+                elif suffix == '.json':
+                    if orjson is not None:
+                        file_config = orjson.loads(self.config_path.read_bytes())
+                    else:
+                        with open(self.config_path, 'r') as f:
+                            file_config = json.load(f)
                 else:
                     raise ConfigurationError(
-                        f"Unsupported config file format: {self.config_path.suffix}",
+                        f"Unsupported config file format: {suffix}",
                         config_file=str(self.config_path)
                     )
                 
                 # Merge with default config
                 self._merge_config(self._raw_config, file_config)
                 
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 raise ConfigurationError(
                     f"Failed to load config file: {e}",
@@ -242,6 +289,7 @@ class ConfigManager:
                 security=SecurityConfig(**self._raw_config.get("security", {})),
                 performance=PerformanceConfig(**self._raw_config.get("performance", {})),
                 verification=VerificationConfig(**self._raw_config.get("verification", {})),
+                engine=EngineConfig(**self._raw_config.get("engine", {})),
                 platform=self._raw_config.get("platform", {}),
                 custom=self._raw_config.get("custom", {}),
             )
@@ -284,6 +332,7 @@ class ConfigManager:
                 "timeout": self._config.api.timeout,
                 "max_retries": self._config.api.max_retries,
                 "retry_delay": self._config.api.retry_delay,
+                "response_cache_size": self._config.api.response_cache_size,
             },
             "gui": {
                 "click_delay": self._config.gui.click_delay,
@@ -309,6 +358,7 @@ class ConfigManager:
                 "api_timeout": self._config.performance.api_timeout,
                 "memory_limit_mb": self._config.performance.memory_limit_mb,
             },
+            "engine": self._config.engine_config(),
             "platform": self._config.platform,
             "custom": self._config.custom,
         }
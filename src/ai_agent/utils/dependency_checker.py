@@ -8,73 +8,240 @@ import sys
 import subprocess
 import platform
 import importlib
+import importlib.metadata
+import importlib.util
+import json
 import os
+import queue
+import random
+import re
 import time
 import socket
+import tempfile
+import threading
+from collections import deque
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 
 
+# Marks a cached lookup that has not been resolved yet
+_UNRESOLVED = object()
+
+# Server-provided wait hint that pip may echo on rate-limited responses
+_RETRY_AFTER_PATTERN = re.compile(r"Retry-After:\s*(\d+)", re.IGNORECASE)
+
+# Upper bound for a single backoff delay, in seconds
+_MAX_RETRY_DELAY = 30.0
+
+
+def _retry_delay(attempt: int, base: float, error_msg: Optional[str] = None) -> float:
+    """Exponential backoff with jitter, stretched to honor any Retry-After hint"""
+    delay = min(_MAX_RETRY_DELAY, base * 2 ** attempt) * random.uniform(0.5, 1.5)
+    if error_msg:
+        match = _RETRY_AFTER_PATTERN.search(error_msg)
+        if match:
+            delay = max(delay, float(match.group(1)))
+    return delay
+
+
+# pip output that means a retry cannot succeed, one named group per failure kind
+_PIP_ERROR_PATTERN = re.compile(
+    r"(?P<permission>Permission denied)"
+    r"|(?P<notfound>Could not find a version|ResolutionImpossible)"
+    r"|(?P<network>Network is unreachable|Connection failed)"
+)
+
+# Trailing pip output lines kept for error messages
+_PIP_OUTPUT_TAIL = 50
+
+
+def _stream_pip(cmd: List[str], timeout: float) -> Tuple[int, str]:
+    """Run pip with merged output echoed as it arrives, stopping on a fatal ERROR line
+    
+    Returns the exit code and the tail of the output. Raises
+    subprocess.TimeoutExpired if the command outlives timeout.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+    expired = threading.Event()
+    
+    def expire():
+        expired.set()
+        proc.kill()
+    
+    watchdog = threading.Timer(timeout, expire)
+    watchdog.start()
+    tail = deque(maxlen=_PIP_OUTPUT_TAIL)
+    try:
+        for line in proc.stdout:
+            tail.append(line)
+            print(f"   {line}", end="")
+            # pip repeats these messages in WARNING lines while its own retries run
+            if line.startswith("ERROR:") and _PIP_ERROR_PATTERN.search(line):
+                proc.terminate()
+                break
+        returncode = proc.wait()
+    finally:
+        watchdog.cancel()
+        proc.stdout.close()
+    
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return returncode, "".join(tail)
+
+
+def _run_system_pip(args: List[str], timeout: float) -> subprocess.CompletedProcess:
+    """Run pip under the current interpreter, isolated unless pip is only a user install
+    
+    -I hides user site-packages and PYTHONPATH, so a pip installed with
+    --user is invisible to it; that case is retried once without -I.
+    """
+    result = subprocess.run(
+        [sys.executable, "-I", "-m", "pip", *args],
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+    if result.returncode != 0 and "No module named pip" in result.stderr:
+        result = subprocess.run(
+            [sys.executable, "-m", "pip", *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+    return result
+
+
+def _requirement_name(requirement: str) -> str:
+    """Get the distribution name from a requirement spec such as 'Pillow>=10.0.0'"""
+    return re.split(r"[<>=!~;\[\s]", requirement, maxsplit=1)[0]
+
+
+def _module_installed(module_name: str) -> bool:
+    """Check whether a module can be found on sys.path without importing it"""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _probe_module(module_name: str, dist_name: Optional[str] = None) -> Tuple[str, bool, Optional[str]]:
+    """Report whether a module is installed and its version, importing only as a last resort"""
+    if not _module_installed(module_name):
+        return module_name, False, None
+    
+    if dist_name:
+        try:
+            return module_name, True, importlib.metadata.version(dist_name)
+        except importlib.metadata.PackageNotFoundError:
+            pass
+    
+    # No distribution metadata, read the version from the module itself
+    try:
+        module = importlib.import_module(module_name)
+    except Exception:
+        return module_name, False, None
+    
+    version = getattr(module, '__version__', None) or getattr(module, 'version', None) or "unknown"
+    return module_name, True, str(version)
+
+
+# Core dependencies that must be available
+CORE_DEPENDENCIES = MappingProxyType({
+    "PIL": "Pillow>=10.0.0",
+    "pyautogui": "pyautogui>=0.9.54", 
+    "mss": "mss>=9.0.0",
+    "requests": "requests>=2.31.0",
+    "cv2": "opencv-python>=4.8.0",
+    "numpy": "numpy>=1.24.0",
+    "pynput": "pynput>=1.7.6",
+    "openai": "openai>=1.0.0",
+    "anthropic": "anthropic>=0.7.0",
+    "transformers": "transformers>=4.35.0",
+    "torch": "torch>=2.1.0",
+    "cryptography": "cryptography>=41.0.0",
+    "pydantic": "pydantic>=2.0.0",
+    "rich": "rich>=13.0.0",
+    "yaml": "PyYAML>=6.0.0",  # yaml module imports as PyYAML package
+    "ollama": "ollama>=0.1.0",  # Add missing ollama dependency
+})
+
+# Platform-specific dependencies
+PLATFORM_DEPENDENCIES = MappingProxyType({
+    "darwin": MappingProxyType({
+        "objc": "pyobjc-framework-Cocoa>=9.0"
+    }),
+    "win32": MappingProxyType({
+        "win32api": "pywin32>=306"
+    }),
+    "linux": MappingProxyType({
+        "Xlib": "python-xlib>=0.33"
+    })
+})
+
+# Distribution name for each module, used for metadata version lookups
+_DIST_NAMES = MappingProxyType({
+    module: _requirement_name(requirement)
+    for deps in (CORE_DEPENDENCIES, *PLATFORM_DEPENDENCIES.values())
+    for module, requirement in deps.items()
+})
+
+# System packages that might need installation
+SYSTEM_PACKAGES = MappingProxyType({
+    "darwin": (
+        "xcode-select",  # For Xcode command line tools
+    ),
+    "win32": (
+        # Windows usually has these pre-installed
+    ),
+    "linux": MappingProxyType({
+        "debian": (
+            "python3-dev", "python3-pip", "python3-venv",
+            "scrot", "python3-tk", "xvfb", "x11-utils"
+        ),
+        "redhat": (
+            "python3-devel", "python3-pip", "scrot", 
+            "tkinter", "xorg-x11-server-Xvfb"
+        )
+    })
+})
+
+
 class DependencyChecker:
     """Comprehensive dependency checking and auto-installation system"""
     
+    __slots__ = (
+        "project_root", "requirements_file", "pyproject_file",
+        "_import_cache", "_venv_python", "_net_ok_at"
+    )
+    
+    # Seconds a successful network check is reused before probing again
+    NETWORK_CHECK_TTL = 60.0
+    
+    # Records a passing full check for the current interpreter and manifests
+    CHECK_CACHE_FILE = ".vexis_depcheck_cache.json"
+    
+    # Shared read-only dependency tables
+    core_dependencies = CORE_DEPENDENCIES
+    platform_dependencies = PLATFORM_DEPENDENCIES
+    system_packages = SYSTEM_PACKAGES
+    _dist_names = _DIST_NAMES
+    
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.requirements_file = project_root / "requirements.txt"
         self.pyproject_file = project_root / "pyproject.toml"
         
-        # Core dependencies that must be available
-        self.core_dependencies = {
-            "PIL": "Pillow>=10.0.0",
-            "pyautogui": "pyautogui>=0.9.54", 
-            "requests": "requests>=2.31.0",
-            "cv2": "opencv-python>=4.8.0",
-            "numpy": "numpy>=1.24.0",
-            "pynput": "pynput>=1.7.6",
-            "openai": "openai>=1.0.0",
-            "anthropic": "anthropic>=0.7.0",
-            "transformers": "transformers>=4.35.0",
-            "torch": "torch>=2.1.0",
-            "cryptography": "cryptography>=41.0.0",
-            "pydantic": "pydantic>=2.0.0",
-            "structlog": "structlog>=23.0.0",
-            "rich": "rich>=13.0.0",
-            "yaml": "PyYAML>=6.0.0",  # yaml module imports as PyYAML package
-            "ollama": "ollama>=0.1.0",  # Add missing ollama dependency
-        }
-        
-        # Platform-specific dependencies
-        self.platform_dependencies = {
-            "darwin": {
-                "objc": "pyobjc-framework-Cocoa>=9.0"
-            },
-            "win32": {
-                "win32api": "pywin32>=306"
-            },
-            "linux": {
-                "Xlib": "python-xlib>=0.33"
-            }
-        }
-        
-        # System packages that might need installation
-        self.system_packages = {
-            "darwin": [
-                "xcode-select",  # For Xcode command line tools
-            ],
-            "win32": [
-                # Windows usually has these pre-installed
-            ],
-            "linux": {
-                "debian": [
-                    "python3-dev", "python3-pip", "python3-venv",
-                    "scrot", "python3-tk", "xvfb", "x11-utils"
-                ],
-                "redhat": [
-                    "python3-devel", "python3-pip", "scrot", 
-                    "tkinter", "xorg-x11-server-Xvfb"
-                ]
-            }
-        }
+        # Probe results per module: (importable, version)
+        self._import_cache: Dict[str, Tuple[bool, Optional[str]]] = {}
+        
+        # Resolved virtual environment interpreter, probed on first use
+        self._venv_python = _UNRESOLVED
+        
+        # Monotonic time of the last successful network check
+        self._net_ok_at: Optional[float] = None
+
 
     def check_python_version(self) -> Tuple[bool, str]:
         """Check if Python version meets requirements"""
@@ -88,13 +255,14 @@ class DependencyChecker:
     
     def check_pip_version(self) -> Tuple[bool, str]:
         """Check if pip is available and reasonably up-to-date"""
+        # Read the installed version in-process before paying for a subprocess
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            return True, f"pip {importlib.metadata.version('pip')} ✓"
+        except importlib.metadata.PackageNotFoundError:
+            pass
+        
+        try:
+            result = _run_system_pip(["--version"], timeout=30)
             if result.returncode == 0:
                 version_str = result.stdout.strip()
                 return True, f"pip {version_str.split()[1]} ✓"
@@ -107,12 +275,7 @@ class DependencyChecker:
         """Upgrade pip to latest version"""
         try:
             print("🔄 Upgrading pip to latest version...")
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", "--upgrade", "pip"],
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
+            result = _run_system_pip(["install", "--upgrade", "pip"], timeout=300)
             if result.returncode == 0:
                 return True, "pip upgraded successfully"
             else:
@@ -120,16 +283,60 @@ class DependencyChecker:
         except Exception as e:
             return False, f"pip upgrade error: {str(e)}"
     
+    @staticmethod
+    def _connect_once(sockaddr: Tuple) -> None:
+        """Open and close a TCP connection to a resolved address"""
+        with socket.create_connection(sockaddr[:2], timeout=10):
+            pass
+    
+    @staticmethod
+    def _run_daemon(results: queue.Queue, func, *args) -> None:
+        """Run func on a daemon thread, posting (result, error) to results"""
+        def target():
+            try:
+                results.put((func(*args), None))
+            except Exception as e:
+                results.put((None, e))
+        threading.Thread(target=target, daemon=True).start()
+    
     def check_network_connectivity(self) -> Tuple[bool, str]:
         """Check if network connectivity is available"""
-        try:
-            # Try to connect to PyPI
-            socket.create_connection(("pypi.org", 443), timeout=10)
+        if self._net_ok_at is not None and time.monotonic() - self._net_ok_at < self.NETWORK_CHECK_TTL:
             return True, "Network connectivity OK ✓"
-        except socket.gaierror:
-            return False, "DNS resolution failed - check internet connection ✗"
-        except socket.timeout:
-            return False, "Network timeout - check internet connection ✗"
+        
+        # Daemon threads so a stalled lookup or connect cannot hold up interpreter exit
+        try:
+            # Resolve PyPI with a bounded wait
+            lookup = queue.Queue()
+            self._run_daemon(lookup, socket.getaddrinfo, "pypi.org", 443, 0, socket.SOCK_STREAM)
+            try:
+                addresses, error = lookup.get(timeout=3)
+            except queue.Empty:
+                return False, "DNS resolution timed out - check internet connection ✗"
+            if isinstance(error, socket.gaierror):
+                return False, "DNS resolution failed - check internet connection ✗"
+            if error is not None:
+                raise error
+            
+            # Race connections to every resolved address (IPv4 and IPv6) under one deadline
+            results = queue.Queue()
+            for address in addresses:
+                self._run_daemon(results, self._connect_once, address[4])
+            deadline = time.monotonic() + 10
+            last_error = None
+            for _ in addresses:
+                try:
+                    _, error = results.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    return False, "Network timeout - check internet connection ✗"
+                if error is None:
+                    self._net_ok_at = time.monotonic()
+                    return True, "Network connectivity OK ✓"
+                last_error = error
+            
+            if isinstance(last_error, socket.timeout):
+                return False, "Network timeout - check internet connection ✗"
+            return False, f"Network check failed: {str(last_error)} ✗"
         except Exception as e:
             return False, f"Network check failed: {str(e)} ✗"
     
@@ -142,31 +349,36 @@ class DependencyChecker:
             return False, "Not in virtual environment (system Python) ⚠️"
     
     def get_venv_python_executable(self) -> Optional[str]:
-        """Get the Python executable path for the virtual environment"""
+        """Get the Python executable path for the virtual environment (cached)"""
+        if self._venv_python is _UNRESOLVED:
+            self._venv_python = self._find_venv_python_executable()
+        return self._venv_python
+    
+    def _invalidate_venv_cache(self):
+        """Re-probe the virtual environment on the next executable lookup"""
+        self._venv_python = _UNRESOLVED
+    
+    def _find_venv_python_executable(self) -> Optional[str]:
+        """Locate the Python executable for the virtual environment on disk"""
         # Check if we're currently in a virtual environment
         venv_ok, venv_msg = self.check_virtual_env()
         if venv_ok:
             return sys.executable
         
         # Check if there's a venv directory in the project root
-        venv_path = self.project_root / "venv"
-        if venv_path.exists() and venv_path.is_dir():
+        venv_path = os.path.join(self.project_root, "venv")
+        if os.path.isdir(venv_path):
             # Try different possible Python executable paths based on platform
             if sys.platform == "win32":
-                python_exe = venv_path / "Scripts" / "python.exe"
-                pythonw_exe = venv_path / "Scripts" / "pythonw.exe"
-                if python_exe.exists():
-                    return str(python_exe)
-                elif pythonw_exe.exists():
-                    return str(pythonw_exe)
+                candidates = (("Scripts", "python.exe"), ("Scripts", "pythonw.exe"))
             else:
                 # Linux/macOS/Unix-like systems
-                python_exe = venv_path / "bin" / "python"
-                python3_exe = venv_path / "bin" / "python3"
-                if python_exe.exists():
-                    return str(python_exe)
-                elif python3_exe.exists():
-                    return str(python3_exe)
+                candidates = (("bin", "python"), ("bin", "python3"))
+            
+            for subdir, name in candidates:
+                python_exe = os.path.join(venv_path, subdir, name)
+                if os.path.isfile(python_exe):
+                    return python_exe
         
         return None
     
@@ -174,11 +386,19 @@ class DependencyChecker:
         """Get the pip executable path for the virtual environment"""
         venv_python = self.get_venv_python_executable()
         if venv_python:
-            # Use python -m pip instead of direct pip path for better reliability
-            return [venv_python, "-m", "pip"]
+            # Use python -m pip instead of direct pip path for better reliability;
+            # -I skips user site and PYTHON* environment processing at startup
+            return [venv_python, "-I", "-m", "pip"]
         
         return None
     
+    def _resolve_pip_cmd(self) -> Tuple[Optional[List[str]], Optional[str], Optional[str]]:
+        """Resolve the virtual environment pip command as (pip_cmd, python_exe, error)"""
+        python_exe = self.get_venv_python_executable()
+        if not python_exe:
+            return None, None, "No virtual environment found. Please create one first."
+        return self.get_venv_pip_executable(), python_exe, None
+    
     def create_virtual_environment(self, force: bool = False) -> Tuple[bool, str]:
         """Create a virtual environment if not in one"""
         if not force:
@@ -188,19 +408,20 @@ class DependencyChecker:
         
         venv_path = self.project_root / "venv"
         
-        if venv_path.exists() and not force:
+        if os.path.isdir(venv_path) and not force:
             return True, f"Virtual environment already exists at {venv_path}"
         
         try:
             print(f"🔧 Creating virtual environment at {venv_path}...")
             result = subprocess.run(
-                [sys.executable, "-m", "venv", str(venv_path)],
+                [sys.executable, "-I", "-m", "venv", str(venv_path)],
                 capture_output=True,
                 text=True,
                 timeout=120
             )
             
             if result.returncode == 0:
+                self._invalidate_venv_cache()
                 print(f"✅ Virtual environment created successfully")
                 # Provide platform-specific activation instructions
                 if sys.platform == "win32":
@@ -218,35 +439,60 @@ class DependencyChecker:
         except Exception as e:
             return False, f"Error creating virtual environment: {str(e)}"
 
-    def check_import(self, module_name: str) -> bool:
-        """Check if a module can be imported"""
+    def _probe(self, module_name: str) -> Tuple[bool, Optional[str]]:
+        """Get the cached (importable, version) result for a module"""
+        if module_name not in self._import_cache:
+            _, ok, version = _probe_module(module_name, self._dist_names.get(module_name, module_name))
+            self._import_cache[module_name] = (ok, version)
+        return self._import_cache[module_name]
+
+    def invalidate_import_cache(self):
+        """Forget probe results so newly installed packages are re-detected"""
+        importlib.invalidate_caches()
+        self._import_cache.clear()
         try:
-            importlib.import_module(module_name)
-            return True
-        except ImportError:
-            return False
-        except PermissionError:
-            # Handle permission errors (e.g., when rich tries to access cwd)
-            return False
+            os.remove(self.project_root / self.CHECK_CACHE_FILE)
         except OSError:
-            # Handle other OS-level errors during import
-            return False
-        except Exception:
-            # Handle any other unexpected import errors
+            pass
+
+    def _check_cache_key(self) -> str:
+        """Build the key that invalidates a cached check when the interpreter or manifests change"""
+        parts = [sys.executable, sys.version]
+        for manifest in (self.requirements_file, self.pyproject_file):
+            try:
+                parts.append(str(os.stat(manifest).st_mtime_ns))
+            except OSError:
+                parts.append("")
+        return "|".join(parts)
+
+    def _cached_check_ok(self) -> bool:
+        """Check whether a previous full check passed under the same key"""
+        try:
+            with open(self.project_root / self.CHECK_CACHE_FILE, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
             return False
+        return cached.get("key") == self._check_cache_key() and cached.get("result") == "ok"
+
+    def _record_check_ok(self):
+        """Persist a passing full check so later runs can skip it"""
+        try:
+            with open(self.project_root / self.CHECK_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump({"key": self._check_cache_key(), "result": "ok"}, f)
+        except OSError:
+            pass
+
+    def check_import(self, module_name: str) -> bool:
+        """Check if a module can be imported"""
+        return self._probe(module_name)[0]
 
     def get_package_version(self, module_name: str) -> Optional[str]:
         """Get version of an installed package"""
-        try:
-            module = importlib.import_module(module_name)
-            if hasattr(module, '__version__'):
-                return module.__version__
-            elif hasattr(module, 'version'):
-                return module.version
-            else:
-                return "unknown"
-        except ImportError:
-            return None
+        return self._probe(module_name)[1]
+
+    def probe_modules(self, modules: List[str]) -> Dict[str, Tuple[bool, Optional[str]]]:
+        """Probe modules that are not cached yet, returning (ok, version) per module"""
+        return {module: self._probe(module) for module in modules}
 
     def check_core_dependencies(self) -> Dict[str, Tuple[bool, str]]:
         """Check all core dependencies"""
@@ -254,9 +500,10 @@ class DependencyChecker:
         
         print("🔍 Checking core Python dependencies...")
         
+        probes = self.probe_modules(list(self.core_dependencies))
         for module, package in self.core_dependencies.items():
-            if self.check_import(module):
-                version = self.get_package_version(module)
+            ok, version = probes[module]
+            if ok:
                 results[module] = (True, f"{package} ({version}) ✓")
             else:
                 results[module] = (False, f"{package} ✗")
@@ -271,204 +518,133 @@ class DependencyChecker:
         print(f"🔍 Checking {current_platform} platform dependencies...")
         
         if current_platform in self.platform_dependencies:
-            for module, package in self.platform_dependencies[current_platform].items():
-                if self.check_import(module):
-                    version = self.get_package_version(module)
+            platform_deps = self.platform_dependencies[current_platform]
+            probes = self.probe_modules(list(platform_deps))
+            for module, package in platform_deps.items():
+                ok, version = probes[module]
+                if ok:
                     results[module] = (True, f"{package} ({version}) ✓")
                 else:
                     results[module] = (False, f"{package} ✗")
         
         return results
 
-    def install_package(self, package: str, retries: int = 3, use_venv: bool = True) -> Tuple[bool, str]:
-        """Install a package using pip with retry mechanism - VENV ONLY MODE"""
+    def _pip_run(self, args: List[str], *, retries: int, timeout: int, what: str,
+                 use_venv: bool = True, base_delay: float = 2) -> Tuple[bool, str]:
+        """Run a pip install command in the virtual environment with retries - VENV ONLY MODE"""
         # Enforce virtual environment usage
         if not use_venv:
             return False, "System Python installation is not allowed. Virtual environment is required."
         
-        # Determine which Python/pip to use
-        pip_cmd = None
-        python_exe = None
-        
-        venv_pip = self.get_venv_pip_executable()
-        if venv_pip:
-            pip_cmd = venv_pip
-            python_exe = self.get_venv_python_executable()
-            print(f"🔧 Using virtual environment: {python_exe}")
-        else:
-            return False, "No virtual environment found. Please create one first."
-        
-        if not pip_cmd:
-            return False, "Virtual environment pip not available. Please recreate the virtual environment."
+        pip_cmd, python_exe, error = self._resolve_pip_cmd()
+        if error:
+            return False, error
+        print(f"🔧 Using virtual environment: {python_exe}")
         
         for attempt in range(retries):
             try:
                 if attempt > 0:
-                    print(f"🔄 Retry {attempt + 1}/{retries} for {package}...")
+                    print(f"🔄 Retry {attempt + 1}/{retries} for {what}...")
                 else:
-                    print(f"📦 Installing {package}...")
+                    print(f"📦 Installing {what}...")
                 
-                result = subprocess.run(
-                    pip_cmd + ["install", package],
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5 minute timeout
-                )
+                returncode, output = _stream_pip(pip_cmd + args, timeout=timeout)
                 
-                if result.returncode == 0:
-                    return True, f"Successfully installed {package}"
+                if returncode == 0:
+                    self.invalidate_import_cache()
+                    return True, f"Successfully installed {what}"
                 else:
-                    error_msg = result.stderr.strip()
+                    error_msg = output.strip()
                     # Check for common issues and provide specific guidance
-                    if "Permission denied" in error_msg:
-                        if use_venv and python_exe:
-                            return False, f"Permission denied installing {package}. Virtual environment may have permission issues."
-                        else:
-                            return False, f"Permission denied installing {package}. Try using --user flag or virtual environment."
-                    elif "Could not find a version" in error_msg:
-                        return False, f"Package {package} not found or version incompatible."
-                    elif "Network is unreachable" in error_msg or "Connection failed" in error_msg:
-                        return False, f"Network error installing {package}. Check internet connection."
+                    match = _PIP_ERROR_PATTERN.search(error_msg)
+                    error_kind = match.lastgroup if match else None
+                    if error_kind == "permission":
+                        return False, f"Permission denied installing {what}. Virtual environment may have permission issues."
+                    elif error_kind == "notfound":
+                        return False, f"Package {what} not found or version incompatible."
+                    elif error_kind == "network":
+                        return False, f"Network error installing {what}. Check internet connection."
                     elif attempt == retries - 1:
-                        return False, f"Failed to install {package} after {retries} attempts: {error_msg}"
+                        return False, f"Failed to install {what} after {retries} attempts: {error_msg}"
                     else:
-                        time.sleep(2)  # Wait before retry
+                        time.sleep(_retry_delay(attempt, base_delay, error_msg))  # Wait before retry
                         continue
                         
             except subprocess.TimeoutExpired:
                 if attempt == retries - 1:
-                    return False, f"Installation of {package} timed out after {retries} attempts"
-                time.sleep(5)  # Wait longer before retry
+                    return False, f"Installation of {what} timed out after {retries} attempts"
+                time.sleep(_retry_delay(attempt, 5))  # Wait longer before retry
                 continue
             except Exception as e:
                 if attempt == retries - 1:
-                    return False, f"Error installing {package}: {str(e)}"
-                time.sleep(2)
+                    return False, f"Error installing {what}: {str(e)}"
+                time.sleep(_retry_delay(attempt, base_delay))
                 continue
         
-        return False, f"Failed to install {package} after {retries} attempts"
+        return False, f"Failed to install {what} after {retries} attempts"
+
+    def install_package(self, package: str, retries: int = 3, use_venv: bool = True,
+                        find_links: Optional[str] = None) -> Tuple[bool, str]:
+        """Install a package using pip with retry mechanism - VENV ONLY MODE"""
+        args = ["install", package]
+        if find_links:
+            args += ["--find-links", find_links]
+        return self._pip_run(args, retries=retries, timeout=300, what=package, use_venv=use_venv)
+
+    def install_packages(self, packages: List[str], retries: int = 3, use_venv: bool = True) -> Tuple[bool, str]:
+        """Install several packages with a single pip invocation - VENV ONLY MODE"""
+        if not packages:
+            return True, "No packages to install"
+        
+        print(f"📦 Batch: {', '.join(packages)}")
+        return self._pip_run(
+            ["install", *packages], retries=retries, timeout=900,
+            what=f"{len(packages)} packages", use_venv=use_venv
+        )
+
+    def _download_package(self, pip_cmd: List[str], package: str, dest: str) -> bool:
+        """Download a package and its dependencies into dest without installing"""
+        try:
+            result = subprocess.run(
+                pip_cmd + ["download", "--dest", dest, package],
+                capture_output=True,
+                text=True,
+                timeout=600  # 10 minute timeout
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
+
+    def download_packages(self, packages: List[str], dest: str, max_workers: int = 4) -> int:
+        """Download packages concurrently into dest, returning how many succeeded"""
+        venv_pip = self.get_venv_pip_executable()
+        if not venv_pip or not packages:
+            return 0
+        
+        # Downloads are network-bound and independent, unlike pip's install phase
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(packages))) as executor:
+            results = executor.map(lambda package: self._download_package(venv_pip, package, dest), packages)
+            return sum(results)
 
     def install_requirements_file(self, retries: int = 2, use_venv: bool = True) -> Tuple[bool, str]:
         """Install all dependencies from requirements.txt with retry - VENV ONLY MODE"""
         if not self.requirements_file.exists():
             return False, "requirements.txt not found"
         
-        # Enforce virtual environment usage
-        if not use_venv:
-            return False, "System Python installation is not allowed. Virtual environment is required."
-        
-        # Determine which Python/pip to use
-        pip_cmd = None
-        python_exe = None
-        
-        venv_pip = self.get_venv_pip_executable()
-        if venv_pip:
-            pip_cmd = venv_pip
-            python_exe = self.get_venv_python_executable()
-            print(f"🔧 Using virtual environment: {python_exe}")
-        else:
-            return False, "No virtual environment found. Please create one first."
-        
-        if not pip_cmd:
-            return False, "Virtual environment pip not available. Please recreate the virtual environment."
-        
-        for attempt in range(retries):
-            try:
-                if attempt > 0:
-                    print(f"🔄 Retry {attempt + 1}/{retries} for requirements.txt...")
-                else:
-                    print("📦 Installing dependencies from requirements.txt...")
-                
-                result = subprocess.run(
-                    pip_cmd + ["install", "-r", str(self.requirements_file)],
-                    capture_output=True,
-                    text=True,
-                    timeout=600  # 10 minute timeout
-                )
-                
-                if result.returncode == 0:
-                    return True, "Successfully installed requirements.txt"
-                else:
-                    error_msg = result.stderr.strip()
-                    if attempt == retries - 1:
-                        return False, f"Failed to install requirements.txt after {retries} attempts: {error_msg}"
-                    else:
-                        time.sleep(3)  # Wait before retry
-                        continue
-                        
-            except subprocess.TimeoutExpired:
-                if attempt == retries - 1:
-                    return False, f"Installation of requirements.txt timed out after {retries} attempts"
-                time.sleep(5)
-                continue
-            except Exception as e:
-                if attempt == retries - 1:
-                    return False, f"Error installing requirements.txt: {str(e)}"
-                time.sleep(3)
-                continue
-        
-        return False, f"Failed to install requirements.txt after {retries} attempts"
+        return self._pip_run(
+            ["install", "-r", str(self.requirements_file)], retries=retries, timeout=600,
+            what="requirements.txt", use_venv=use_venv, base_delay=3
+        )
 
     def install_project(self, retries: int = 2, use_venv: bool = True) -> Tuple[bool, str]:
         """Install the project in editable mode with retry - VENV ONLY MODE"""
         if not self.pyproject_file.exists():
             return False, "pyproject.toml not found"
         
-        # Enforce virtual environment usage
-        if not use_venv:
-            return False, "System Python installation is not allowed. Virtual environment is required."
-        
-        # Determine which Python/pip to use
-        pip_cmd = None
-        python_exe = None
-        
-        venv_pip = self.get_venv_pip_executable()
-        if venv_pip:
-            pip_cmd = venv_pip
-            python_exe = self.get_venv_python_executable()
-            print(f"🔧 Using virtual environment: {python_exe}")
-        else:
-            return False, "No virtual environment found. Please create one first."
-        
-        if not pip_cmd:
-            return False, "Virtual environment pip not available. Please recreate the virtual environment."
-        
-        for attempt in range(retries):
-            try:
-                if attempt > 0:
-                    print(f"🔄 Retry {attempt + 1}/{retries} for project installation...")
-                else:
-                    print("📦 Installing project in editable mode...")
-                
-                result = subprocess.run(
-                    pip_cmd + ["install", "-e", str(self.project_root)],
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5 minute timeout
-                )
-                
-                if result.returncode == 0:
-                    return True, "Successfully installed project"
-                else:
-                    error_msg = result.stderr.strip()
-                    if attempt == retries - 1:
-                        return False, f"Failed to install project after {retries} attempts: {error_msg}"
-                    else:
-                        time.sleep(3)
-                        continue
-                        
-            except subprocess.TimeoutExpired:
-                if attempt == retries - 1:
-                    return False, f"Project installation timed out after {retries} attempts"
-                time.sleep(5)
-                continue
-            except Exception as e:
-                if attempt == retries - 1:
-                    return False, f"Error installing project: {str(e)}"
-                time.sleep(3)
-                continue
-        
-        return False, f"Failed to install project after {retries} attempts"
+        return self._pip_run(
+            ["install", "-e", str(self.project_root)], retries=retries, timeout=300,
+            what="project", use_venv=use_venv, base_delay=3
+        )
 
     def check_system_dependencies(self) -> Dict[str, Tuple[bool, str]]:
         """Check system-level dependencies"""
@@ -572,10 +748,10 @@ class DependencyChecker:
                 return True
             else:
                 print(f"⚠️  {message}")
-                print("🔄 Falling back to individual package installation...")
+                print("🔄 Falling back to direct package installation...")
         
-        # Fall back to individual package installation
-        failed_packages = []
+        # Map missing modules to their package specs
+        packages = {}
         for dep in missing_deps:
             if dep in self.core_dependencies:
                 package = self.core_dependencies[dep]
@@ -587,13 +763,28 @@ class DependencyChecker:
                     package = dep
             else:
                 package = dep
-            
-            success, message = self.install_package(package, use_venv=use_venv)
-            if success:
-                print(f"✅ {message}")
-            else:
-                print(f"❌ {message}")
-                failed_packages.append(dep)
+            packages[dep] = package
+        
+        # Install everything in one resolver run, then per package if the batch fails
+        failed_packages = []
+        success, message = self.install_packages(list(packages.values()), use_venv=use_venv)
+        if success:
+            print(f"✅ {message}")
+        else:
+            print(f"⚠️  {message}")
+            print("🔄 Falling back to individual package installation...")
+            with tempfile.TemporaryDirectory(prefix="vexis-wheels-") as wheel_dir:
+                # Fetch in parallel, then install one at a time from the local cache
+                print(f"📥 Downloading {len(packages)} packages in parallel...")
+                self.download_packages(list(packages.values()), wheel_dir)
+                
+                for dep, package in packages.items():
+                    success, message = self.install_package(package, use_venv=use_venv, find_links=wheel_dir)
+                    if success:
+                        print(f"✅ {message}")
+                    else:
+                        print(f"❌ {message}")
+                        failed_packages.append(dep)
         
         # Install project in editable mode
         success, message = self.install_project(use_venv=use_venv)
@@ -625,6 +816,18 @@ class DependencyChecker:
             print("❌ Python version too old. Please upgrade to Python 3.8 or higher.")
             return False
         
+        # A previous run already verified this interpreter against these manifests
+        if self._cached_check_ok():
+            print("\n✅ All dependencies are satisfied!")
+            return True
+        
+        # Fast path: nothing to report when every Python dependency is already present.
+        # Not cached, since system packages were not checked
+        required = [*self.core_dependencies, *self.platform_dependencies.get(sys.platform, ())]
+        if all(_module_installed(module) for module in required):
+            print("\n✅ All dependencies are satisfied!")
+            return True
+        
         # Check core dependencies
         core_results = self.check_core_dependencies()
         missing_core = [mod for mod, (ok, _) in core_results.items() if not ok]
@@ -642,6 +845,7 @@ class DependencyChecker:
         
         if not all_missing and not missing_system:
             print("\n✅ All dependencies are satisfied!")
+            self._record_check_ok()
             return True
         
         print(f"\n📊 Dependency Summary:")
@@ -685,6 +889,8 @@ class DependencyChecker:
                 final_missing = [mod for mod in all_missing if not self.check_import(mod)]
                 if not final_missing:
                     print(f"\n🎉 All dependencies successfully installed!")
+                    if not missing_system:
+                        self._record_check_ok()
                     return True
                 else:
                     print(f"\n⚠️  Some dependencies could not be installed automatically")
@@ -115,6 +115,35 @@ class DependencyInstaller:
         except (subprocess.TimeoutExpired, Exception):
             return False
     
+    def compile_bytecode(self, project_root: Path) -> bool:
+        """Precompile the package to .pyc so the first run skips compilation
+        
+        Editable installs (and uv without --compile-bytecode) leave this to
+        the first import.
+        
+        Args:
+            project_root: Root directory of the project
+            
+        Returns:
+            True if compilation was successful
+        """
+        venv_python = self.venv_manager.get_venv_python_path()
+        if not venv_python:
+            return False
+        
+        package_dir = project_root / "src" / "ai_agent"
+        if not package_dir.exists():
+            return True
+        
+        try:
+            result = subprocess.run(
+                [venv_python, "-m", "compileall", "-q", "-j", "0", str(package_dir)],
+                capture_output=True, text=True, timeout=300
+            )
+            return result.returncode == 0
+        except (subprocess.TimeoutExpired, Exception):
+            return False
+    
     def install_all_dependencies(self, project_root: Path) -> bool:
         """Install all dependencies with proper error handling
         
@@ -141,6 +170,9 @@ class DependencyInstaller:
         if not self.install_project(project_root):
             print("Warning: Project installation failed")
         
+        if not self.compile_bytecode(project_root):
+            print("Warning: Bytecode precompilation failed")
+        
         return True
     
     def request_dependency_installation_permission(self, project_root: Path) -> bool:
@@ -239,5 +271,8 @@ class DependencyInstaller:
         if not self.install_project(project_root):
             print("Warning: Project installation failed")
         
+        if not self.compile_bytecode(project_root):
+            print("Warning: Bytecode precompilation failed")
+        
         print("✓ Dependencies installed successfully")
         return True
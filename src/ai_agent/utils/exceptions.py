@@ -6,20 +6,26 @@ Minimal exceptions for 2-Phase Architecture
 
 class AIAgentException(Exception):
     """Base exception for AI Agent system"""
-    pass
+    def __init__(self, message="", error_code=None, context=None, **details):
+        super().__init__(message)
+        self.error_code = error_code
+        # Extra keyword details (e.g. capture_method=...) are folded into context
+        if details:
+            context = {**(context or {}), **details}
+        self.context = context
 
 
 class APIError(AIAgentException):
     """API-related error"""
-    def __init__(self, message, status_code=None):
-        super().__init__(message)
+    def __init__(self, message, status_code=None, error_code=None, context=None, **details):
+        super().__init__(message, error_code, context, **details)
         self.status_code = status_code
 
 
 class ValidationError(AIAgentException):
     """Validation error"""
-    def __init__(self, message, field=None, value=None):
-        super().__init__(message)
+    def __init__(self, message, field=None, value=None, error_code=None, context=None, **details):
+        super().__init__(message, error_code, context, **details)
         self.field = field
         self.value = value
 
@@ -46,8 +52,8 @@ class ExecutionError(AIAgentException):
 
 class TaskGenerationError(AIAgentException):
     """Task generation error"""
-    def __init__(self, message, instruction=None):
-        super().__init__(message)
+    def __init__(self, message, instruction=None, error_code=None, context=None, **details):
+        super().__init__(message, error_code, context, **details)
         self.instruction = instruction
 
 
@@ -58,6 +64,6 @@ class CommandParsingError(AIAgentException):
 
 class VerificationError(AIAgentException):
     """Task verification error"""
-    def __init__(self, message, task=None):
-        super().__init__(message)
+    def __init__(self, message, task=None, error_code=None, context=None, **details):
+        super().__init__(message, error_code, context, **details)
         self.task = task
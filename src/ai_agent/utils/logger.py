@@ -3,27 +3,77 @@ Comprehensive logging system for AI Agent
 Zero-defect policy: detailed logging with structured output
 """
 
+import os
 import sys
+import time
+import atexit
+import copy
+import functools
 import logging
+import logging.handlers
+import queue
+import threading
 try:
-    import structlog
+    import orjson
 except ImportError:
-    structlog = None
-from typing import Optional, Dict, Any
+    orjson = None
+from typing import Optional, Dict, Any, Set, Tuple, Union
 from pathlib import Path
-from datetime import datetime
 import json
 import traceback
 
-from .exceptions import AIAgentException
+
+# Directories already created by ensure_parent_dir
+_ensured_dirs: Set[str] = set()
+
+
+def ensure_parent_dir(file_path: Union[str, Path]) -> None:
+    """Create a file's parent directory, at most once per process"""
+    parent = os.path.dirname(os.fspath(file_path)) or "."
+    if parent not in _ensured_dirs:
+        os.makedirs(parent, exist_ok=True)
+        _ensured_dirs.add(parent)
+
+
+# Standard LogRecord attributes, never emitted as extra fields
+_RESERVED_LOGRECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'lineno', 'funcName', 'created',
+    'msecs', 'relativeCreated', 'thread', 'threadName',
+    'processName', 'process', 'getMessage', 'exc_info',
+    'exc_text', 'stack_info', 'message', 'asctime', 'taskName',
+})
+
+# Attribute count of a bare LogRecord; only larger records can carry extra fields
+_BASE_LOGRECORD_SIZE = len(logging.LogRecord("", logging.INFO, "", 0, "", None, None).__dict__)
+
+
+@functools.lru_cache(maxsize=4)
+def _format_log_seconds(seconds: int) -> str:
+    """Local ISO-8601 date and time for a whole epoch second"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+
+
+def _format_log_timestamp(created: float) -> str:
+    """Same output as datetime.fromtimestamp(created).isoformat(), reusing the per-second prefix"""
+    seconds = int(created)
+    microseconds = round((created - seconds) * 1e6)
+    if microseconds == 1_000_000:
+        seconds += 1
+        microseconds = 0
+    
+    prefix = _format_log_seconds(seconds)
+    return f"{prefix}.{microseconds:06d}" if microseconds else prefix
 
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging"""
     
     def format(self, record: logging.LogRecord) -> str:
+        record_dict = record.__dict__
+        exc_info = record.exc_info
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": _format_log_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -33,30 +83,78 @@ class JSONFormatter(logging.Formatter):
         }
         
         # Add exception info if present
-        if record.exc_info:
+        if exc_info:
             log_entry["exception"] = {
-                "type": record.exc_info[0].__name__,
-                "message": str(record.exc_info[1]),
-                "traceback": traceback.format_exception(*record.exc_info)
+                "type": exc_info[0].__name__,
+                "message": str(exc_info[1]),
+                "traceback": traceback.format_exception(*exc_info)
             }
         
         # Add extra fields
-        for key, value in record.__dict__.items():
-            if key not in {
-                'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                'filename', 'module', 'lineno', 'funcName', 'created',
-                'msecs', 'relativeCreated', 'thread', 'threadName',
-                'processName', 'process', 'getMessage', 'exc_info',
-                'exc_text', 'stack_info'
-            }:
-                log_entry[key] = value
+        if len(record_dict) > _BASE_LOGRECORD_SIZE:
+            for key, value in record_dict.items():
+                if key not in _RESERVED_LOGRECORD_ATTRS:
+                    log_entry[key] = value
         
+        if orjson is not None:
+            return orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
         return json.dumps(log_entry, default=str)
 
 
+# Formatters are stateless, so every handler shares these two
+_JSON_FORMATTER = JSONFormatter()
+_TEXT_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that hands records to the listener without pre-formatting them"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args into a copy, so other handlers keep the original record,
+        # and keep exc_info so the target formatter sees the full record
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Queue and background listener per (log file, JSON format), shared by every
+# logger that writes to that file and stopped by the atexit hook below
+_file_listeners: Dict[Tuple[str, bool], Tuple[queue.SimpleQueue, logging.handlers.QueueListener]] = {}
+_file_listeners_lock = threading.Lock()
+
+
+def _file_queue_handler(log_file: str, enable_json: bool, level: int) -> logging.Handler:
+    """Queue handler feeding the shared listener thread for log_file, started on first use"""
+    key = (os.path.abspath(log_file), enable_json)
+    # Held across check and insert so concurrent first uses start one listener
+    with _file_listeners_lock:
+        if key not in _file_listeners:
+            ensure_parent_dir(log_file)
+            
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setFormatter(_JSON_FORMATTER if enable_json else _TEXT_FORMATTER)
+            
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            _file_listeners[key] = (log_queue, listener)
+        log_queue = _file_listeners[key][0]
+    
+    # Levels are applied on the producer side, since loggers share the file handler
+    queue_handler = _RecordQueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    return queue_handler
+
+
 class AIAgentLogger:
     """Enhanced logger for AI Agent with comprehensive features"""
     
+    __slots__ = (
+        "name", "log_level", "log_file", "enable_json", "enable_console",
+        "logger", "_is_enabled_for",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -73,21 +171,17 @@ class AIAgentLogger:
         
         self.logger = logging.getLogger(name)
         self.logger.setLevel(self.log_level)
+        self._is_enabled_for = self.logger.isEnabledFor
         
         # Clear existing handlers
         self.logger.handlers.clear()
         
         # Setup handlers
         self._setup_handlers()
-        
-        # Setup structlog processor
-        self._setup_structlog()
     
     def _setup_handlers(self):
         """Setup logging handlers"""
-        formatter = JSONFormatter() if self.enable_json else logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        formatter = _JSON_FORMATTER if self.enable_json else _TEXT_FORMATTER
         
         # Console handler
         if self.enable_console:
@@ -96,62 +190,55 @@ class AIAgentLogger:
             console_handler.setFormatter(formatter)
             self.logger.addHandler(console_handler)
         
-        # File handler
+        # File writes happen on a shared listener thread; the console stays
+        # synchronous so log lines keep their order with printed output
         if self.log_file:
-            log_path = Path(self.log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            file_handler = logging.FileHandler(log_path)
-            file_handler.setLevel(self.log_level)
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
-    
-    def _setup_structlog(self):
-        """Setup structlog with fallback to standard logging"""
-        if structlog is not None:
-            try:
-                structlog.configure(
-                    processors=[
-                        structlog.stdlib.filter_by_level,
-                        structlog.stdlib.add_logger_name,
-                        structlog.stdlib.add_log_level,
-                        structlog.stdlib.PositionalArgumentsFormatter(),
-                    ],
-                    context_class=dict,
-                    logger_factory=structlog.stdlib.LoggerFactory(),
-                    wrapper_class=structlog.stdlib.BoundLogger,
-                    cache_logger_on_first_use=True,
-                )
-                self.use_structlog = True
-            except Exception as e:
-                print(f"Warning: Could not configure structlog: {e}")
-                self.use_structlog = False
-        else:
-            self.use_structlog = False
+            self.logger.addHandler(_file_queue_handler(self.log_file, self.enable_json, self.log_level))
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message at this level would be emitted"""
+        return self.logger.isEnabledFor(level)
     
     def debug(self, message: str, **kwargs):
         """Log debug message"""
-        self.logger.debug(message, extra=kwargs)
+        if not self._is_enabled_for(logging.DEBUG):
+            return
+        self.logger.debug(message, extra=kwargs or None)
     
     def info(self, message: str, **kwargs):
         """Log info message"""
-        self.logger.info(message, extra=kwargs)
+        if not self._is_enabled_for(logging.INFO):
+            return
+        self.logger.info(message, extra=kwargs or None)
     
     def warning(self, message: str, **kwargs):
         """Log warning message"""
-        self.logger.warning(message, extra=kwargs)
+        if not self._is_enabled_for(logging.WARNING):
+            return
+        self.logger.warning(message, extra=kwargs or None)
     
     def error(self, message: str, **kwargs):
         """Log error message"""
-        self.logger.error(message, extra=kwargs)
+        if not self._is_enabled_for(logging.ERROR):
+            return
+        self.logger.error(message, extra=kwargs or None)
     
     def critical(self, message: str, **kwargs):
         """Log critical message"""
-        self.logger.critical(message, extra=kwargs)
+        if not self._is_enabled_for(logging.CRITICAL):
+            return
+        self.logger.critical(message, extra=kwargs or None)
     
     def exception(self, message: str, **kwargs):
         """Log exception with traceback"""
-        self.logger.exception(message, extra=kwargs)
+        if not self._is_enabled_for(logging.ERROR):
+            return
+        self.logger.exception(message, extra=kwargs or None)
+    
+    def log_event(self, message: str, level: int = logging.INFO, **fields):
+        """Log a structured event, passing its fields as extras"""
+        if self._is_enabled_for(level):
+            self.logger.log(level, message, extra=fields or None)
     
     def log_command(
         self,
@@ -162,7 +249,7 @@ class AIAgentLogger:
         **kwargs
     ):
         """Log command execution"""
-        self.info(
+        self.log_event(
             "Command executed",
             command=command,
             success=success,
@@ -180,7 +267,7 @@ class AIAgentLogger:
         **kwargs
     ):
         """Log screenshot capture"""
-        self.info(
+        self.log_event(
             "Screenshot captured",
             screenshot_path=screenshot_path,
             resolution=resolution,
@@ -199,7 +286,7 @@ class AIAgentLogger:
         **kwargs
     ):
         """Log API call"""
-        self.info(
+        self.log_event(
             "API call",
             endpoint=endpoint,
             method=method,
@@ -219,7 +306,7 @@ class AIAgentLogger:
         **kwargs
     ):
         """Log task step"""
-        self.info(
+        self.log_event(
             "Task step",
             task_id=task_id,
             step=step,
@@ -235,17 +322,16 @@ class AIAgentLogger:
         context: Optional[Dict[str, Any]] = None
     ):
         """Log error with full context"""
+        if not self._is_enabled_for(logging.ERROR):
+            return
+        
         error_info = {
             "error_type": type(error).__name__,
             "error_message": str(error),
+            "error_code": getattr(error, "error_code", None),
+            "context": getattr(error, "context", None),
         }
         
-        if isinstance(error, AIAgentException):
-            error_info.update({
-                "error_code": error.error_code,
-                "context": error.context,
-            })
-        
         if context:
             error_info["context"] = context
         
@@ -265,7 +351,7 @@ class AIAgentLogger:
         **kwargs
     ):
         """Log command generation from AI"""
-        self.info(
+        self.log_event(
             "Command generated",
             event_type="command_generation",
             task_description=task_description,
@@ -286,7 +372,7 @@ class AIAgentLogger:
         **kwargs
     ):
         """Log task execution completion"""
-        self.info(
+        self.log_event(
             "Task execution completed",
             event_type="task_execution",
             task_index=task_index,
@@ -298,9 +384,25 @@ class AIAgentLogger:
         )
 
 
-# Global logger registry
+# Global logger registry; the first caller's settings win for each name
 _loggers: Dict[str, AIAgentLogger] = {}
 
+# Logging section of the loaded configuration, read once
+_default_logger_config: Optional[Dict[str, Any]] = None
+
+
+def _get_default_logger_config() -> Dict[str, Any]:
+    """Get the logging configuration defaults (cached)"""
+    global _default_logger_config
+    
+    if _default_logger_config is None:
+        from .config import load_config
+        config = load_config()
+        
+        _default_logger_config = config.logging.__dict__ if hasattr(config.logging, '__dict__') else {}
+    
+    return _default_logger_config
+
 
 def get_logger(
     name: Optional[str] = None,
@@ -315,10 +417,7 @@ def get_logger(
     
     if name not in _loggers:
         # Get default configuration
-        from .config import load_config
-        config = load_config()
-        
-        logger_config = config.logging.__dict__ if hasattr(config.logging, '__dict__') else {}
+        logger_config = _get_default_logger_config()
         
         _loggers[name] = AIAgentLogger(
             name=name,
@@ -338,39 +437,48 @@ def setup_logging(
     enable_console: bool = True
 ):
     """Setup global logging configuration"""
+    level = getattr(logging, log_level.upper())
+    
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
+    root_logger.setLevel(level)
     
     # Clear existing handlers
     root_logger.handlers.clear()
     
-    formatter = JSONFormatter() if enable_json else logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    formatter = _JSON_FORMATTER if enable_json else _TEXT_FORMATTER
     
     # Console handler
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, log_level.upper()))
+        console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
         root_logger.addHandler(console_handler)
     
     # File handler
     if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setLevel(getattr(logging, log_level.upper()))
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        root_logger.addHandler(_file_queue_handler(log_file, enable_json, level))
+
+
+def _stop_file_listeners():
+    """Flush queued file records and stop every shared listener thread"""
+    with _file_listeners_lock:
+        listeners = [listener for _, listener in _file_listeners.values()]
+        _file_listeners.clear()
+    
+    for listener in listeners:
+        listener.stop()
+
+
+atexit.register(_stop_file_listeners)
 
 
 # Context manager for logging
 class LogContext:
     """Context manager for adding logging context"""
     
+    __slots__ = ("logger", "context")
+    
     def __init__(self, logger: AIAgentLogger, **context):
         self.logger = logger
         self.context = context
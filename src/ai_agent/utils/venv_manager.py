@@ -9,12 +9,60 @@ import os
 import subprocess
 import platform
 import shutil
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 VENV_DIR = "venv"
 
 
+@functools.lru_cache(maxsize=None)
+def _python_runs(python_path: str) -> bool:
+    """Check that an interpreter starts, probing each path once per process
+    
+    Args:
+        python_path: Path to the Python executable
+        
+    Returns:
+        True if the interpreter ran successfully
+    """
+    try:
+        result = subprocess.run([python_path, "--version"],
+                                capture_output=True, text=True, timeout=10)
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+def _remove_tree(path: Path) -> bool:
+    """Delete a virtual environment tree, removing installed packages concurrently
+    
+    Args:
+        path: Directory to delete
+        
+    Returns:
+        True if the tree was removed
+    """
+    try:
+        # Nearly every file lives under site-packages, one directory per
+        # distribution, so those directories are the units worth spreading out
+        packages = []
+        for site_packages in (*path.glob("lib/python*/site-packages"), *path.glob("Lib/site-packages")):
+            with os.scandir(site_packages) as entries:
+                packages.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+        
+        # Deletion is I/O-bound, so package directories go in parallel
+        if packages:
+            with ThreadPoolExecutor(max_workers=min(8, len(packages))) as executor:
+                list(executor.map(shutil.rmtree, packages))
+        
+        shutil.rmtree(path)
+        return True
+    except OSError:
+        return False
+
+
 class VirtualEnvManager:
     """Manages virtual environment operations"""
     
@@ -45,19 +93,29 @@ class VirtualEnvManager:
         Returns:
             Path to Python executable in venv, or None if not found
         """
-        if not self.venv_path.exists():
+        venv_path = str(self.venv_path)
+        if not os.path.isdir(venv_path):
             return None
         
         if platform.system() == "Windows":
-            python_exe = self.venv_path / "Scripts" / "python.exe"
-            if not python_exe.exists():
-                python_exe = self.venv_path / "Scripts" / "pythonw.exe"
+            python_exe = os.path.join(venv_path, "Scripts", "python.exe")
+            if not os.path.isfile(python_exe):
+                python_exe = os.path.join(venv_path, "Scripts", "pythonw.exe")
         else:
-            python_exe = self.venv_path / "bin" / "python"
-            if not python_exe.exists():
-                python_exe = self.venv_path / "bin" / "python3"
+            python_exe = os.path.join(venv_path, "bin", "python")
+            if not os.path.isfile(python_exe):
+                python_exe = os.path.join(venv_path, "bin", "python3")
+        
+        return python_exe if os.path.isfile(python_exe) else None
+    
+    def is_venv_python_working(self) -> bool:
+        """Check if the virtual environment has a runnable Python (cached)
         
-        return str(python_exe) if python_exe.exists() else None
+        Returns:
+            True if the venv interpreter exists and starts
+        """
+        venv_python = self.get_venv_python_path()
+        return venv_python is not None and _python_runs(venv_python)
     
     def check_prerequisites(self) -> bool:
         """Check if virtual environment creation prerequisites are met
@@ -78,16 +136,10 @@ class VirtualEnvManager:
             True if environment was created successfully
         """
         if self.venv_path.exists():
-            venv_python = self.get_venv_python_path()
-            if venv_python:
-                try:
-                    result = subprocess.run([venv_python, "--version"], 
-                                          capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        return True
-                except Exception:
-                    pass
-                shutil.rmtree(self.venv_path)
+            if self.is_venv_python_working():
+                return True
+            if self.get_venv_python_path() and not _remove_tree(self.venv_path):
+                return False
         
         try:
             result = subprocess.run(
@@ -96,6 +148,8 @@ class VirtualEnvManager:
                 text=True,
                 timeout=120
             )
+            # The recreated interpreter must be probed afresh
+            _python_runs.cache_clear()
             return result.returncode == 0
         except (subprocess.TimeoutExpired, Exception):
             return False
@@ -133,17 +187,9 @@ class VirtualEnvManager:
         Returns:
             True if environment was created successfully or user declined
         """
-        if self.venv_path.exists():
-            venv_python = self.get_venv_python_path()
-            if venv_python:
-                try:
-                    result = subprocess.run([venv_python, "--version"], 
-                                          capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        print("✓ Virtual environment already exists")
-                        return True
-                except Exception:
-                    pass
+        if self.venv_path.exists() and self.is_venv_python_working():
+            print("✓ Virtual environment already exists")
+            return True
         
         if not self.request_venv_creation_permission():
             return False
@@ -175,6 +221,10 @@ class VirtualEnvManager:
         
         new_argv = [venv_python, script_path, "--__venv_restarted__"] + args
         
+        # execv discards unflushed buffers along with the process image
+        sys.stdout.flush()
+        sys.stderr.flush()
+        
         try:
             os.execv(venv_python, new_argv)
             return True